@@ -25,8 +25,8 @@ from app.utils.parsing_db import (
     save_parsing_failure
 )
 from app.utils.file_utils import (
-    generate_version_folder_name,
-    create_versioned_output_dir
+    prepare_output_layout,
+    save_preview_file
 )
 
 router = APIRouter()
@@ -79,22 +79,17 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
         if opts.use_remote_ocr and REMOTE_OCR_AVAILABLE:
             strategy = f'Remote OCR ({opts.remote_ocr_engine or "paddleocr"})'
 
-            # Generate version folder name
-            version_folder = generate_version_folder_name(
-                strategy=strategy,
+            # Version folder + output directory + output structure in one pass
+            version_folder, doc_output_dir, output_structure = prepare_output_layout(
+                file_path,
+                OUTPUT_FOLDER,
+                strategy,
                 options={
                     "remote_ocr_engine": opts.remote_ocr_engine or "paddleocr",
                     "remote_ocr_languages": opts.remote_ocr_languages or ["kor", "eng"]
                 }
             )
 
-            # Create versioned output directory
-            doc_output_dir = create_versioned_output_dir(
-                file_path=file_path,
-                base_dir=OUTPUT_FOLDER,
-                version_folder=version_folder
-            )
-
             # Run Remote OCR in separate thread to avoid blocking event loop
             update_progress(15, "Starting Remote OCR processing...")
 
@@ -108,6 +103,9 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 progress_callback=update_progress
             )
 
+            # Save preview sidecar for the listing endpoint
+            save_preview_file(doc_output_dir, content)
+
             # Build result
             from app.models import ParseResponse, ParsingMetadata
 
@@ -116,12 +114,7 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 db=db,
                 db_document=db_document,
                 strategy=strategy,
-                output_structure={
-                    "output_dir": str(doc_output_dir),
-                    "content_file": str(doc_output_dir / "content.md"),
-                    "images_dir": None,
-                    "tables_dir": None
-                },
+                output_structure=output_structure.to_dict(),
                 duration_seconds=time.time() - start_time,
                 options=opts,
                 version_folder=version_folder,
@@ -162,21 +155,18 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                     picture_description_enabled=False,
                     auto_image_analysis_enabled=False
                 ),
-                output_structure={
-                    "output_dir": str(doc_output_dir),
-                    "content_file": str(doc_output_dir / "content.md"),
-                    "images_dir": None,
-                    "tables_dir": None
-                }
+                output_structure=output_structure.to_dict()
             )
 
         elif is_pdf and opts.use_dolphin and DOLPHIN_REMOTE_AVAILABLE:
             # Dolphin Remote GPU parsing with progress tracking
             strategy = f'Dolphin Remote GPU ({opts.dolphin_parsing_level or "normal"})'
 
-            # Generate version folder name
-            version_folder = generate_version_folder_name(
-                strategy=strategy,
+            # Version folder + output directory + output structure in one pass
+            version_folder, doc_output_dir, output_structure = prepare_output_layout(
+                file_path,
+                OUTPUT_FOLDER,
+                strategy,
                 options={
                     "dolphin_parsing_level": opts.dolphin_parsing_level or "normal",
                     "dolphin_max_batch_size": opts.dolphin_max_batch_size,
@@ -184,13 +174,6 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 }
             )
 
-            # Create versioned output directory
-            doc_output_dir = create_versioned_output_dir(
-                file_path=file_path,
-                base_dir=OUTPUT_FOLDER,
-                version_folder=version_folder
-            )
-
             # Run Dolphin Remote in separate thread to avoid blocking event loop
             content, metadata = await asyncio.to_thread(
                 parse_with_dolphin_remote,
@@ -202,6 +185,9 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 progress_callback=update_progress
             )
 
+            # Save preview sidecar for the listing endpoint
+            save_preview_file(doc_output_dir, content)
+
             # Build result
             from app.models import ParseResponse, ParsingMetadata
 
@@ -210,12 +196,7 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 db=db,
                 db_document=db_document,
                 strategy=strategy,
-                output_structure={
-                    "output_dir": str(doc_output_dir),
-                    "content_file": str(doc_output_dir / "content.md"),
-                    "images_dir": None,
-                    "tables_dir": None
-                },
+                output_structure=output_structure.to_dict(),
                 duration_seconds=time.time() - start_time,
                 options=opts,
                 version_folder=version_folder,
@@ -269,21 +250,17 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
             # MinerU parsing with progress tracking
             strategy = f'MinerU ({"with OCR" if opts.mineru_use_ocr else "no OCR"})'
 
-            # Generate version folder name
-            version_folder = generate_version_folder_name(
-                strategy=strategy,
+            # Version folder + output directory + output structure in one pass
+            version_folder, doc_output_dir, output_structure = prepare_output_layout(
+                file_path,
+                OUTPUT_FOLDER,
+                strategy,
                 options={
                     "mineru_use_ocr": opts.mineru_use_ocr,
                     "mineru_lang": opts.mineru_lang,
                     "output_format": opts.output_format
-                }
-            )
-
-            # Create versioned output directory
-            doc_output_dir = create_versioned_output_dir(
-                file_path=file_path,
-                base_dir=OUTPUT_FOLDER,
-                version_folder=version_folder
+                },
+                has_images=True
             )
 
             # Run blocking MinerU parser in separate thread to avoid blocking event loop
@@ -297,6 +274,9 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 progress_callback=update_progress
             )
 
+            # Save preview sidecar for the listing endpoint
+            save_preview_file(doc_output_dir, content)
+
             # Build result
             from app.models import ParseResponse, ParsingMetadata
 
@@ -305,12 +285,7 @@ async def _run_parsing_job(job_id: str, request: ParseRequest, db: Session):
                 db=db,
                 db_document=db_document,
                 strategy=strategy,
-                output_structure={
-                    "output_dir": str(doc_output_dir),
-                    "content_file": str(doc_output_dir / "content.md"),
-                    "images_dir": str(doc_output_dir / "images"),
-                    "tables_dir": None
-                },
+                output_structure=output_structure.to_dict(),
                 duration_seconds=time.time() - start_time,
                 options=opts,
                 version_folder=version_folder,
@@ -4,7 +4,7 @@ Database query endpoints.
 Provides access to document metadata, chunks, tables, and parsing history from the database.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
@@ -18,26 +18,37 @@ logger = logging.getLogger(__name__)
 
 @router.get("/db/documents", response_model=List[schemas.DocumentSchema])
 async def list_documents_db(
-    skip: int = 0,
+    response: Response,
+    cursor: Optional[int] = None,
     limit: int = 100,
     status: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    List all documents from database with optional filtering.
+    List all documents from database with optional filtering, in ID order.
 
-    - **skip**: Number of records to skip (pagination)
+    - **cursor**: ID of the last document of the previous page (keyset pagination)
     - **limit**: Maximum number of records to return
     - **status**: Filter by parsing status (pending, processing, completed, failed)
+
+    When more documents may follow, the ``X-Next-Cursor`` response header
+    holds the cursor for the next page.
     """
     try:
-        documents = crud.list_documents(db, skip=skip, limit=limit, status=status)
+        # Documents and their aggregated counts in a single query
+        documents, next_cursor = crud.list_documents_with_counts(
+            db,
+            cursor=(None, cursor) if cursor is not None else None,
+            limit=limit,
+            status=status,
+            order_by=None
+        )
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = str(next_cursor[1])
 
-        # Add aggregated counts for each document
         result = []
-        for doc in documents:
-            doc_data = crud.get_document_with_counts(db, doc.id)
-            doc_schema = schemas.DocumentSchema.model_validate(doc)
+        for doc_data in documents:
+            doc_schema = schemas.DocumentSchema.model_validate(doc_data["document"])
             doc_schema.chunk_count = doc_data["chunk_count"]
             doc_schema.table_count = doc_data["table_count"]
             doc_schema.picture_count = doc_data["picture_count"]
@@ -57,14 +68,15 @@ async def get_document_detail(document_id: int, db: Session = Depends(get_db)):
     - **document_id**: Document ID from database
     """
     try:
-        document = crud.get_document_by_id(db, document_id)
+        # Document with its tables and pictures eagerly loaded
+        document = crud.get_document_full(db, document_id)
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
 
         # Get related data
-        tables = crud.get_tables_by_document_id(db, document_id)
+        tables = document.tables
         history = crud.get_parsing_history(db, document_id)
-        pictures = crud.get_pictures_by_document_id(db, document_id)
+        pictures = document.pictures
 
         # Create detailed response
         doc_dict = schemas.DocumentSchema.model_validate(document).model_dump()
@@ -94,8 +106,7 @@ async def get_document_tables(document_id: int, db: Session = Depends(get_db)):
     """
     try:
         # Check if document exists
-        document = crud.get_document_by_id(db, document_id)
-        if not document:
+        if not crud.document_exists(db, document_id):
             raise HTTPException(status_code=404, detail="Document not found")
 
         tables = crud.get_tables_by_document_id(db, document_id)
@@ -117,8 +128,7 @@ async def get_document_history(document_id: int, limit: int = 10, db: Session =
     """
     try:
         # Check if document exists
-        document = crud.get_document_by_id(db, document_id)
-        if not document:
+        if not crud.document_exists(db, document_id):
             raise HTTPException(status_code=404, detail="Document not found")
 
         history = crud.get_parsing_history(db, document_id, limit=limit)
@@ -211,7 +211,7 @@ async def list_parsed_documents(db: Session = Depends(get_db)):
 
     try:
         # Query documents from database with counts (completed status only)
-        db_documents = crud.list_documents_with_counts(
+        db_documents, _ = crud.list_documents_with_counts(
             db,
             limit=1000,
             status="completed",
@@ -378,17 +378,12 @@ async def get_indexing_status(
 
         # Update upload log if completed
         if status.indexing_status in ["completed", "error"]:
-            # Find log by batch_id
-            logs = crud.get_upload_history(db, limit=100)
-            for log in logs:
-                if log.batch_id == batch_id:
-                    crud.update_upload_log(
-                        db=db,
-                        log_id=log.id,
-                        indexing_status=status.indexing_status,
-                        completed_at=datetime.utcnow()
-                    )
-                    break
+            # Update every log of this batch in one statement
+            completed_at = datetime.utcnow()
+            crud.update_upload_logs_bulk(db, [
+                {"id": log_id, "indexing_status": status.indexing_status, "completed_at": completed_at}
+                for log_id in crud.get_upload_log_ids_by_batch(db, batch_id)
+            ])
 
         return status
 
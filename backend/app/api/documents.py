@@ -9,6 +9,7 @@ from fastapi.responses import FileResponse
 from pathlib import Path
 from typing import List
 import logging
+import os
 
 from app.config import DOCU_FOLDER
 from app.models import DocumentInfo
@@ -16,19 +17,25 @@ from app.models import DocumentInfo
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Document types shown in the docu folder listing
+DOCUMENT_EXTENSIONS = frozenset({'.pdf', '.docx', '.pptx', '.html'})
+
 
 @router.get("/documents", response_model=List[DocumentInfo])
 async def list_documents():
     """List documents in docu folder"""
     try:
         documents = []
-        for file_path in DOCU_FOLDER.iterdir():
-            if file_path.is_file() and file_path.suffix in ['.pdf', '.docx', '.pptx', '.html']:
-                documents.append(DocumentInfo(
-                    filename=file_path.name,
-                    size=file_path.stat().st_size,
-                    extension=file_path.suffix
-                ))
+        # scandir: is_file() comes from the directory listing, stat() is only needed for size
+        with os.scandir(DOCU_FOLDER) as entries:
+            for entry in entries:
+                extension = os.path.splitext(entry.name)[1]
+                if extension in DOCUMENT_EXTENSIONS and entry.is_file():
+                    documents.append(DocumentInfo(
+                        filename=entry.name,
+                        size=entry.stat().st_size,
+                        extension=extension
+                    ))
         return documents
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,6 +7,7 @@ Main parsing logic that orchestrates Docling, Camelot, and VLM processing.
 import json
 import logging
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -15,7 +16,7 @@ from sqlalchemy.orm import Session
 
 from app.config import DOCU_FOLDER, OUTPUT_FOLDER
 from app.database import get_db
-from app.models import ParseRequest, ParseResponse, ParsingMetadata
+from app.models import ParseRequest, ParseResponse, ParsingMetadata, TableParsingOptions
 from app.services.docling import parse_document_with_docling
 from app.services.mineru_parser import MINERU_AVAILABLE, parse_with_mineru
 from app.services.pictures import (
@@ -34,6 +35,8 @@ from app.utils.file_utils import (
     create_document_output_dir,
     create_versioned_output_dir,
     generate_version_folder_name,
+    prepare_output_layout,
+    save_preview_file,
 )
 from app.utils.parsing_db import (
     create_or_update_document_record,
@@ -45,6 +48,175 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ParseOutcome:
+    """Result of a single parser branch (Remote OCR, MinerU, Docling)"""
+    strategy: str
+    version_folder: str
+    content: str
+    parsing_metadata: ParsingMetadata
+    table_summary: Optional[Dict[str, Any]] = None
+    output_structure: Optional[Dict[str, Any]] = None
+    output_dir: Optional[Path] = None  # Versioned output dir prepared for table extraction
+    docling_doc: Optional[Any] = None
+    will_use_camelot: bool = False
+
+
+def _parse_remote_ocr(file_path: Path, opts: TableParsingOptions) -> ParseOutcome:
+    """Parse with Remote OCR (Korean/scanned documents, images)"""
+    strategy = f"Remote OCR ({opts.remote_ocr_engine})"
+    logger.info(f"📄 Parsing: {file_path.name} | Strategy: {strategy}")
+
+    # Version folder + output directory + output structure in one pass
+    version_folder, doc_output_dir, output_structure = prepare_output_layout(
+        file_path,
+        OUTPUT_FOLDER,
+        strategy,
+        options={
+            "remote_ocr_engine": opts.remote_ocr_engine,
+            "remote_ocr_languages": opts.remote_ocr_languages,
+        },
+    )
+
+    # Remote OCR로 파싱
+    ocr_langs = opts.remote_ocr_languages or ["kor", "eng"]
+    content, remote_ocr_metadata = parse_with_remote_ocr(
+        file_path,
+        ocr_engine=opts.remote_ocr_engine,
+        ocr_languages=ocr_langs,
+        output_dir=doc_output_dir if opts.save_to_output_folder else None,
+    )
+
+    logger.info(f"✅ Remote OCR parsing completed ({opts.remote_ocr_engine})")
+
+    return ParseOutcome(
+        strategy=strategy,
+        version_folder=version_folder,
+        content=content,
+        # Remote OCR은 텍스트만 추출
+        table_summary={
+            "parsing_method": "remote_ocr",
+            "ocr_engine": opts.remote_ocr_engine,
+            "ocr_languages": ocr_langs,
+            "total_pages": remote_ocr_metadata.get("pages", 1),
+            "total_characters": remote_ocr_metadata.get("characters_extracted", 0),
+        },
+        output_structure=output_structure.to_dict(),
+        parsing_metadata=ParsingMetadata(
+            parser_used="remote_ocr",
+            table_parser=None,
+            ocr_enabled=True,
+            ocr_engine=f"remote-{opts.remote_ocr_engine}",
+            output_format="markdown",  # Remote OCR는 항상 Markdown
+            picture_description_enabled=False,
+            auto_image_analysis_enabled=False,
+        ),
+    )
+
+
+def _parse_mineru(file_path: Path, opts: TableParsingOptions) -> ParseOutcome:
+    """Parse with MinerU (universal PDF parser, handles tables itself)"""
+    strategy = "MinerU (Universal)"
+    logger.info(f"📄 Parsing: {file_path.name} | Strategy: {strategy}")
+
+    # Version folder + output directory + output structure in one pass
+    # (MinerU는 자체적으로 content.md와 images/를 생성)
+    version_folder, doc_output_dir, output_structure = prepare_output_layout(
+        file_path, OUTPUT_FOLDER, strategy, has_images=True
+    )
+
+    # MinerU로 파싱 (로컬 라이브러리)
+    content, mineru_metadata = parse_with_mineru(
+        file_path,
+        output_dir=doc_output_dir,
+        output_format=opts.output_format,
+        lang=opts.mineru_lang,
+        use_ocr=opts.mineru_use_ocr,
+        progress_callback=None,  # No progress tracking in sync mode
+    )
+
+    return ParseOutcome(
+        strategy=strategy,
+        version_folder=version_folder,
+        content=content,
+        # MinerU는 자체적으로 표를 처리하므로 table_summary는 MinerU 메타데이터 사용
+        table_summary={
+            "total_tables": mineru_metadata.get("tables", 0),
+            "total_images": mineru_metadata.get("images", 0),
+            "total_formulas": mineru_metadata.get("formulas", 0),
+            "parsing_method": "mineru",
+            "language": mineru_metadata.get("language"),
+            "ocr_enabled": mineru_metadata.get("ocr_enabled", False),
+        },
+        output_structure=output_structure.to_dict(),
+        parsing_metadata=ParsingMetadata(
+            parser_used="mineru",
+            table_parser="mineru",
+            ocr_enabled=opts.mineru_use_ocr,
+            output_format=opts.output_format,
+            mineru_lang=opts.mineru_lang,
+            picture_description_enabled=False,
+            auto_image_analysis_enabled=False,
+        ),
+    )
+
+
+def _parse_docling(file_path: Path, opts: TableParsingOptions) -> ParseOutcome:
+    """Parse with Docling (+ Camelot tables for PDFs when requested)"""
+    is_pdf = file_path.suffix.lower() == ".pdf"
+    will_use_camelot = opts.use_camelot and is_pdf and CAMELOT_AVAILABLE
+
+    if is_pdf and opts.use_camelot and not CAMELOT_AVAILABLE:
+        logger.warning("⚠️ Camelot requested but not available. Falling back to Docling.")
+
+    strategy = "Docling+Camelot Hybrid" if will_use_camelot else "Docling Only"
+    logger.info(f"📄 Parsing: {file_path.name} | Strategy: {strategy}")
+
+    version_options = {
+        "camelot_mode": opts.camelot_mode if will_use_camelot else None,
+        "ocr_engine": opts.ocr_engine if opts.do_ocr else None,
+        "ocr_lang": opts.ocr_lang if opts.do_ocr else None,
+    }
+
+    version_folder = generate_version_folder_name(strategy, version_options)
+
+    # Force Markdown table export when using Camelot (for compatibility)
+    if will_use_camelot and opts.tables_as_html:
+        logger.info("  Forcing tables_as_html=False for Camelot compatibility")
+
+    # Parse document using Docling library directly
+    # Returns (content, docling_document) for Phase 3+ table extraction
+    content, docling_doc = parse_document_with_docling(file_path, opts)
+
+    # Output folder is only used when tables are extracted; otherwise the
+    # result is saved to the docu folder (legacy mode). Created after a
+    # successful parse so a failed parse leaves no empty version folder.
+    doc_output_dir: Optional[Path] = None
+    if opts.extract_tables and opts.save_to_output_folder and docling_doc:
+        doc_output_dir = create_versioned_output_dir(
+            file_path=file_path, base_dir=OUTPUT_FOLDER, version_folder=version_folder
+        )
+
+    return ParseOutcome(
+        strategy=strategy,
+        version_folder=version_folder,
+        content=content,
+        output_dir=doc_output_dir,
+        docling_doc=docling_doc,
+        will_use_camelot=will_use_camelot,
+        parsing_metadata=ParsingMetadata(
+            parser_used="docling",
+            table_parser="camelot" if will_use_camelot else "docling",
+            ocr_enabled=opts.do_ocr,
+            ocr_engine=opts.ocr_engine if opts.do_ocr else None,
+            output_format=opts.output_format,
+            camelot_mode=opts.camelot_mode if will_use_camelot else None,
+            picture_description_enabled=opts.do_picture_description,
+            auto_image_analysis_enabled=opts.auto_image_analysis,
+        ),
+    )
+
+
 @router.post("/parse", response_model=ParseResponse)
 async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
     """Parse document in docu folder to Markdown/HTML/JSON using Docling library"""
@@ -53,15 +225,9 @@ async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
     # Initialize all variables explicitly to avoid locals() anti-pattern
     db_document: Optional[Any] = None
     warnings: List[str] = []
-    table_summary: Optional[Dict[str, Any]] = None
-    output_structure: Optional[Dict[str, str]] = None
+    outcome: Optional[ParseOutcome] = None
     output_path: Optional[Path] = None
     table_extractions: List[Any] = []
-    parsing_metadata: Optional[ParsingMetadata] = None
-    docling_doc: Optional[Any] = None
-    strategy: str = ""
-    will_use_camelot: bool = False
-    version_folder: Optional[str] = None  # Version management
 
     try:
         file_path = DOCU_FOLDER / request.filename
@@ -79,207 +245,49 @@ async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
         # Auto-select parsing strategy based on file type
         is_pdf = file_path.suffix.lower() == ".pdf"
 
-        # 🆕 Remote OCR 사용 (한글 문서 최적화, 스캔된 PDF/이미지)
-        if opts.use_remote_ocr and REMOTE_OCR_AVAILABLE:
-            strategy = f"Remote OCR ({opts.remote_ocr_engine})"
-            logger.info(f"📄 Parsing: {request.filename} | Strategy: {strategy}")
-
-            # Generate version folder name
-            version_folder = generate_version_folder_name(
-                strategy=strategy,
-                options={
-                    "remote_ocr_engine": opts.remote_ocr_engine,
-                    "remote_ocr_languages": opts.remote_ocr_languages,
-                },
-            )
-
-            # Create versioned output directory
-            doc_output_dir = create_versioned_output_dir(
-                file_path=file_path, base_dir=OUTPUT_FOLDER, version_folder=version_folder
-            )
-
-            # Remote OCR로 파싱
-            try:
-                ocr_langs = opts.remote_ocr_languages or ["kor", "eng"]
-                content, remote_ocr_metadata = parse_with_remote_ocr(
-                    file_path,
-                    ocr_engine=opts.remote_ocr_engine,
-                    ocr_languages=ocr_langs,
-                    output_dir=doc_output_dir if opts.save_to_output_folder else None,
-                )
-
-                # 메타데이터 변환
-                table_summary = {
-                    "parsing_method": "remote_ocr",
-                    "ocr_engine": opts.remote_ocr_engine,
-                    "ocr_languages": ocr_langs,
-                    "total_pages": remote_ocr_metadata.get("pages", 1),
-                    "total_characters": remote_ocr_metadata.get(
-                        "characters_extracted", 0
-                    ),
-                }
-
-                # Remote OCR은 텍스트만 추출
-                table_extractions = []
-                docling_doc = None
-
-                # Parsing metadata
-                parsing_metadata = ParsingMetadata(
-                    parser_used="remote_ocr",
-                    table_parser=None,
-                    ocr_enabled=True,
-                    ocr_engine=f"remote-{opts.remote_ocr_engine}",
-                    output_format="markdown",  # Remote OCR는 항상 Markdown
-                    picture_description_enabled=False,
-                    auto_image_analysis_enabled=False,
-                )
-
-                # output_structure 설정
-                output_structure = build_output_structure(
-                    doc_output_dir, has_tables=False, has_images=False
-                ).to_dict()
-                output_path = Path(output_structure["content_file"])
-
-                logger.info(
-                    f"✅ Remote OCR parsing completed ({opts.remote_ocr_engine})"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Error during Remote OCR parsing: {str(e)}", exc_info=True
-                )
-                raise HTTPException(
-                    status_code=500, detail=f"Remote OCR parsing failed: {str(e)}"
-                )
-
-        elif opts.use_remote_ocr and not REMOTE_OCR_AVAILABLE:
-            # Remote OCR 요청했지만 서버 연결 안 됨 → 경고 후 fallback
+        if opts.use_remote_ocr and not REMOTE_OCR_AVAILABLE:
+            # Remote OCR 요청했지만 서버 연결 안 됨 → 경고 후 다음 전략으로 fallback
             warnings.append(
                 "Remote OCR Server not available. Falling back to Docling with EasyOCR."
             )
             logger.warning(
                 "⚠️ Remote OCR requested but server not available, falling back to Docling"
             )
-            # Continue to next strategy (Dolphin or Docling)
-
-        # 🆕 MinerU 우선 사용 (범용 솔루션)
-        elif is_pdf and opts.use_mineru and MINERU_AVAILABLE:
-            strategy = "MinerU (Universal)"
-            logger.info(f"📄 Parsing: {request.filename} | Strategy: {strategy}")
-
-            # Generate version folder name
-            version_folder = generate_version_folder_name(strategy=strategy)
-
-            # Create versioned output directory
-            doc_output_dir = create_versioned_output_dir(
-                file_path=file_path, base_dir=OUTPUT_FOLDER, version_folder=version_folder
-            )
-
-            # MinerU로 파싱 (로컬 라이브러리)
-            try:
-                content, mineru_metadata = parse_with_mineru(
-                    file_path,
-                    output_dir=doc_output_dir,
-                    output_format=opts.output_format,
-                    lang=opts.mineru_lang,
-                    use_ocr=opts.mineru_use_ocr,
-                    progress_callback=None,  # No progress tracking in sync mode
-                )
 
-                # MinerU는 자체적으로 표를 처리하므로 table_summary는 MinerU 메타데이터 사용
-                table_summary = {
-                    "total_tables": mineru_metadata.get("tables", 0),
-                    "total_images": mineru_metadata.get("images", 0),
-                    "total_formulas": mineru_metadata.get("formulas", 0),
-                    "parsing_method": "mineru",
-                    "language": mineru_metadata.get("language"),
-                    "ocr_enabled": mineru_metadata.get("ocr_enabled", False),
-                }
-
-                # MinerU는 자체적으로 표를 처리하므로 별도 table_extractions 불필요
-                table_extractions = []
-
-                docling_doc = None  # MinerU는 docling_doc 불필요
-
-                # Parsing metadata for MinerU
-                parsing_metadata = ParsingMetadata(
-                    parser_used="mineru",
-                    table_parser="mineru",
-                    ocr_enabled=opts.mineru_use_ocr,
-                    output_format=opts.output_format,
-                    mineru_lang=opts.mineru_lang,
-                    picture_description_enabled=False,
-                    auto_image_analysis_enabled=False,
-                )
-
-                # MinerU는 자체적으로 content.md를 생성하므로 output_structure 설정
-                output_structure = build_output_structure(
-                    doc_output_dir, has_tables=False, has_images=True
-                ).to_dict()
-                output_path = Path(output_structure["content_file"])
-
-            except Exception as e:
-                logger.error(f"Error during MinerU parsing: {str(e)}", exc_info=True)
-                raise HTTPException(
-                    status_code=500, detail=f"MinerU parsing failed: {str(e)}"
+        if opts.use_remote_ocr and REMOTE_OCR_AVAILABLE:
+            # 🆕 Remote OCR 사용 (한글 문서 최적화, 스캔된 PDF/이미지)
+            parser, parser_label = _parse_remote_ocr, "Remote OCR parsing"
+        elif is_pdf and opts.use_mineru:
+            if not MINERU_AVAILABLE:
+                # MinerU 요청했지만 설치 안 됨 → 에러 반환 (fallback 없음)
+                error_msg = (
+                    "MinerU is not installed. Please install MinerU to use this feature.\n\n"
+                    "Installation command:\n"
+                    "  pip install magic-pdf[full]\n\n"
+                    "Or use Camelot/Docling parsing strategy instead."
                 )
-
-        elif is_pdf and opts.use_mineru and not MINERU_AVAILABLE:
-            # MinerU 요청했지만 설치 안 됨 → 에러 반환 (fallback 없음)
-            error_msg = (
-                "MinerU is not installed. Please install MinerU to use this feature.\n\n"
-                "Installation command:\n"
-                "  pip install magic-pdf[full]\n\n"
-                "Or use Camelot/Docling parsing strategy instead."
-            )
-            logger.error("MinerU requested but not available")
-            raise HTTPException(status_code=400, detail=error_msg)
-
+                logger.error("MinerU requested but not available")
+                raise HTTPException(status_code=400, detail=error_msg)
+            # 🆕 MinerU 우선 사용 (범용 솔루션)
+            parser, parser_label = _parse_mineru, "MinerU parsing"
         else:
             # 기존 Camelot/Docling 로직 (MinerU 미사용)
-            will_use_camelot = opts.use_camelot and is_pdf and CAMELOT_AVAILABLE
-
-            if is_pdf and opts.use_camelot and not CAMELOT_AVAILABLE:
-                logger.warning(
-                    "⚠️ Camelot requested but not available. Falling back to Docling."
-                )
-
-            strategy = "Docling+Camelot Hybrid" if will_use_camelot else "Docling Only"
-            logger.info(f"📄 Parsing: {request.filename} | Strategy: {strategy}")
-
-            # Generate version folder name
-            version_folder = generate_version_folder_name(
-                strategy=strategy,
-                options={
-                    "camelot_mode": opts.camelot_mode if will_use_camelot else None,
-                    "ocr_engine": opts.ocr_engine if opts.do_ocr else None,
-                    "ocr_lang": opts.ocr_lang if opts.do_ocr else None,
-                },
-            )
-
-            # Force Markdown table export when using Camelot (for compatibility)
-            if will_use_camelot and opts.tables_as_html:
-                logger.info("  Forcing tables_as_html=False for Camelot compatibility")
-
-            # Parse document using Docling library directly
-            # Returns (content, docling_document) for Phase 3+ table extraction
-            try:
-                content, docling_doc = parse_document_with_docling(file_path, opts)
-            except Exception as e:
-                logger.error(f"Error during Docling parsing: {str(e)}", exc_info=True)
-                raise HTTPException(status_code=500, detail=f"Parsing failed: {str(e)}")
-
-            # Parsing metadata for Docling+Camelot
-            parsing_metadata = ParsingMetadata(
-                parser_used="docling",
-                table_parser="camelot" if will_use_camelot else "docling",
-                ocr_enabled=opts.do_ocr,
-                ocr_engine=opts.ocr_engine if opts.do_ocr else None,
-                output_format=opts.output_format,
-                camelot_mode=opts.camelot_mode if will_use_camelot else None,
-                picture_description_enabled=opts.do_picture_description,
-                auto_image_analysis_enabled=opts.auto_image_analysis,
-            )
+            parser, parser_label = _parse_docling, "Parsing"
+
+        try:
+            outcome = parser(file_path, opts)
+        except Exception as e:
+            logger.exception(f"Error during {parser_label}")
+            raise HTTPException(status_code=500, detail=f"{parser_label} failed: {str(e)}")
+
+        content = outcome.content
+        docling_doc = outcome.docling_doc
+        table_summary = outcome.table_summary
+        output_structure = outcome.output_structure
+        parsing_metadata = outcome.parsing_metadata
+        will_use_camelot = outcome.will_use_camelot
+        if output_structure is not None:
+            output_path = Path(output_structure["content_file"])
 
         # Phase 3: Extract tables if enabled
         # NOTE: MinerU 사용 시 table_summary와 output_structure가 이미 설정되어 있음
@@ -290,14 +298,10 @@ async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
             and opts.save_to_output_folder
             and docling_doc
             and output_structure is None
+            and outcome.output_dir is not None
         ):
+            doc_output_dir = outcome.output_dir
             try:
-                # Create versioned output directory
-                doc_output_dir = create_versioned_output_dir(
-                    file_path=file_path,
-                    base_dir=OUTPUT_FOLDER,
-                    version_folder=version_folder,
-                )
                 doc_name = file_path.stem
 
                 # Choose extraction method: Camelot (PDF, high accuracy) or Docling (all formats)
@@ -383,11 +387,11 @@ async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
         save_parsing_success(
             db=db,
             db_document=db_document,
-            strategy=strategy,
+            strategy=outcome.strategy,
             output_structure=output_structure,
             duration_seconds=duration_seconds,
             options=opts,
-            version_folder=version_folder,
+            version_folder=outcome.version_folder,
             table_summary=table_summary,
             table_extractions=table_extractions if table_extractions else None,
             parsing_method="camelot" if will_use_camelot else "docling",
@@ -434,6 +438,13 @@ async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
             except Exception as e:
                 logger.error(f"Error extracting picture info: {str(e)}", exc_info=True)
 
+        # Save preview sidecar so the listing endpoint doesn't need to open content.md
+        if output_structure is not None:
+            try:
+                save_preview_file(Path(output_structure["output_dir"]), content)
+            except Exception as e:
+                logger.error(f"Error saving preview file: {str(e)}", exc_info=True)
+
         # Save parsing metadata to JSON file for later retrieval
         if parsing_metadata is not None and output_structure is not None:
             try:
@@ -469,18 +480,18 @@ async def parse_document(request: ParseRequest, db: Session = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error parsing document: {str(e)}", exc_info=True)
+        logger.exception("Error parsing document")
 
         # Save failure to database
         duration_seconds = time.time() - start_time
         save_parsing_failure(
             db=db,
             db_document=db_document,
-            strategy=strategy if strategy else None,
+            strategy=outcome.strategy if outcome else None,
             error_message=str(e),
             duration_seconds=duration_seconds,
             options=request.get_options(),
-            version_folder=version_folder,
+            version_folder=outcome.version_folder if outcome else None,
         )
 
         return ParseResponse(success=False, filename=request.filename, error=str(e))
@@ -4,195 +4,537 @@ Parsed results endpoints.
 Handles listing and retrieving previously parsed documents.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from functools import lru_cache
+import asyncio
 import logging
 import json
-from sqlalchemy.orm import Session
+import os
+import time
+import zlib
+from sqlalchemy import and_, case, func, not_
+from sqlalchemy.orm import Session, joinedload
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.config import OUTPUT_FOLDER
-from app.models import ParseResponse, ParsingMetadata
+from app.models import ParsingMetadata
 from app.database import get_db
-from app import crud
+from app import crud, db_models
+from app.utils.file_utils import PREVIEW_FILENAME
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# orjson parses bytes directly (no UTF-8 decode in Python); stdlib json.loads accepts bytes too
+_loads = orjson.loads if orjson else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when available)."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Extensions stripped from a requested filename to get the output folder name
+KNOWN_EXTENSIONS = frozenset({'.pdf', '.docx', '.pptx', '.html', '.txt', '.md'})
+# Extensions tried, in order, when a document name has to be matched against DB filenames
+FALLBACK_EXTENSIONS = ('.pdf', '.docx', '.pptx', '.html', '.txt')
+
+# Serialize responses with orjson when it is installed
+_JSONResponse = ORJSONResponse if orjson else JSONResponse
+
+# Serialized /parsed-documents payloads, reused for LISTING_CACHE_TTL seconds while the
+# set of completed parsing histories is unchanged.
+# (show_all_versions, limit, preview, name_prefix) -> (created monotonic time, history signature, JSON bytes)
+LISTING_CACHE_TTL = 5.0
+LISTING_CACHE_MAX_ENTRIES = 32
+_listing_cache: Dict[Tuple[bool, int, bool, Optional[str]], Tuple[float, Tuple[int, Optional[int]], bytes]] = {}
+
+# Pre-serialized body for the listing when no parse has completed
+_EMPTY_LISTING_PAYLOAD = _dumps({"total": 0, "documents": []})
+
+# Characters of preview text per listing row, and bytes read from content.md when no
+# preview sidecar exists (enough for LISTING_PREVIEW_CHARS at up to 4 bytes per character)
+LISTING_PREVIEW_CHARS = 200
+PREVIEW_READ_BYTES = 1024
+
+# Characters per block when streaming content.md in get_parse_result
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on concurrent file reads while building the parsed-documents listing
+LISTING_IO_CONCURRENCY = 32
+_listing_io_semaphore = asyncio.Semaphore(LISTING_IO_CONCURRENCY)
 
+
+# parsing_strategy -> parser_used rules, checked in order on the lowercased strategy:
+# (keywords that must all appear, keywords that must not appear, parser_used).
+# No match means "docling". Shared by the Python mapping and its SQL CASE form.
+_STRATEGY_RULES = (
+    (("dolphin",), (), "dolphin"),
+    (("mineru",), (), "mineru"),
+    (("remote", "ocr"), (), "remote_ocr"),
+    (("camelot",), ("docling",), "camelot"),
+)
+_DEFAULT_PARSER = "docling"
+
+
+# parsing_strategy values are a small closed set, so mappings are memoized per raw string;
+# lru_cache keeps the memo bounded even if unexpected strategy strings show up
+@lru_cache(maxsize=64)
 def _map_strategy_to_parser(strategy: str) -> str:
     """Map database parsing_strategy to parser_used name"""
     strategy_lower = strategy.lower()
+    for required, excluded, parser in _STRATEGY_RULES:
+        if all(k in strategy_lower for k in required) and not any(k in strategy_lower for k in excluded):
+            return parser
+    return _DEFAULT_PARSER
+
+
+def _db_metadata(parser_used: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    parsing_metadata rebuilt from DB fields for results without a metadata.json.
+
+    Args:
+        parser_used: Parser name mapped from parsing_strategy
+        options: Parsed options_json of the parsing history, if stored
+
+    Returns:
+        Dict with the ParsingMetadata fields; options not stored fall back to defaults
+    """
+    options = options or {}
+    return {
+        "parser_used": parser_used,
+        "table_parser": options.get("table_parser"),
+        "ocr_enabled": options.get("do_ocr", False),
+        "ocr_engine": options.get("ocr_engine"),
+        "output_format": options.get("output_format", "markdown"),
+        "picture_description_enabled": options.get("do_picture_description", False),
+        "auto_image_analysis_enabled": options.get("auto_image_analysis", False)
+    }
+
+
+@lru_cache(maxsize=4096)
+def _stem(name: str) -> str:
+    """Filename without its last extension; same result as Path(name).stem for plain filenames."""
+    i = name.rfind('.')
+    return name[:i] if 0 < i < len(name) - 1 else name
+
+
+def _parser_used_column():
+    """SQL CASE equivalent of _map_strategy_to_parser, evaluated by the database per row."""
+    strategy = db_models.ParsingHistory.parsing_strategy
+    whens = [
+        (
+            and_(
+                *[strategy.ilike(f"%{k}%") for k in required],
+                *[not_(strategy.ilike(f"%{k}%")) for k in excluded]
+            ),
+            parser
+        )
+        for required, excluded, parser in _STRATEGY_RULES
+    ]
+    return case(*whens, else_=_DEFAULT_PARSER).label("parser_used")
+
+
+@lru_cache(maxsize=512)
+def _read_metadata_bytes(path_str: str, mtime_ns: int) -> bytes:
+    """
+    Raw metadata.json bytes, cached per (path, mtime_ns).
+
+    Raw bytes are cached rather than the parsed dict so callers always get a
+    fresh, mutable dict; a rewritten file has a new mtime and so a new key.
+    """
+    with open(path_str, 'rb') as f:
+        return f.read()
+
+
+def _load_metadata(path) -> Optional[Dict[str, Any]]:
+    """Load metadata.json through the mtime-keyed cache. Returns None if the file is missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _loads(_read_metadata_bytes(str(path), st.st_mtime_ns))
+
+
+@lru_cache(maxsize=512)
+def _read_preview(content_path_str: str, mtime_ns: int, size: int) -> str:
+    """
+    Preview text for a content.md, cached per (path, mtime_ns, size).
+
+    Uses the preview sidecar written at parse time; older parses have no
+    sidecar, so the head of content.md is read as raw bytes and decoded.
+    """
+    content_file = Path(content_path_str)
+    try:
+        content = (content_file.parent / PREVIEW_FILENAME).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        # PREVIEW_READ_BYTES holds more than LISTING_PREVIEW_CHARS characters even at
+        # 4 bytes per UTF-8 character; a character cut at the end of the read is dropped
+        fd = os.open(content_path_str, os.O_RDONLY)
+        try:
+            raw = os.read(fd, PREVIEW_READ_BYTES)
+        finally:
+            os.close(fd)
+        content = raw.decode('utf-8', 'ignore')
+    if len(content) > LISTING_PREVIEW_CHARS:
+        return content[:LISTING_PREVIEW_CHARS] + "..."
+    return content
+
+
+@lru_cache(maxsize=1024)
+def _scan_tables_dir(tables_dir_str: str, mtime_ns: int) -> Tuple[Tuple[str, ...], int, int]:
+    """
+    Classify table_* files in a tables directory with a single scandir pass.
+
+    Cached per (path, mtime_ns); adding or removing a file changes the
+    directory mtime and so the key.
+
+    Returns:
+        (json table ids, csv table count, markdown table count)
+    """
+    json_ids = []
+    csv_count = 0
+    md_count = 0
+    with os.scandir(tables_dir_str) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith("table_"):
+                continue
+            if name.endswith(".json"):
+                json_ids.append(name[:-5])
+            elif name.endswith(".csv"):
+                csv_count += 1
+            elif name.endswith(".md"):
+                md_count += 1
+    return tuple(json_ids), csv_count, md_count
+
+
+def _read_listing_files(
+    filename: str,
+    content_path: Optional[str],
+    metadata_path: Optional[str],
+    include_preview: bool = True
+) -> Tuple[str, float, Optional[Dict[str, Any]]]:
+    """
+    Read preview, content size and metadata.json for one parsing result.
+
+    Blocking file I/O; called from a worker thread by list_parsed_documents.
+
+    Returns:
+        (preview, content_size_kb, parsing_metadata or None)
+    """
+    preview = ""
+    content_size_kb = 0
+
+    if content_path:
+        try:
+            stat = os.stat(content_path)
+            if include_preview:
+                preview = _read_preview(content_path, stat.st_mtime_ns, stat.st_size)
+            content_size_kb = round(stat.st_size / 1024, 2)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error reading content file for {filename}: {str(e)}")
+
+    parsing_metadata = None
+    if metadata_path:
+        try:
+            parsing_metadata = _load_metadata(metadata_path)
+        except Exception as e:
+            logger.error(f"Error loading metadata for {filename}: {str(e)}")
+
+    return preview, content_size_kb, parsing_metadata
+
+
+def _stream_parse_result(content_file: Path, envelope: Dict[str, Any]) -> Iterator[bytes]:
+    """
+    Stream a ParseResponse JSON body whose markdown field is the content of content_file.
+
+    content.md is read in STREAM_CHUNK_SIZE-character blocks and each block is JSON-escaped
+    as it is sent, so memory stays bounded for multi-MB documents. Stats are
+    counted in the same pass and emitted after the markdown field.
+    """
+    yield _dumps(envelope)[:-1] + b',"markdown":"'
+
+    lines = 1
+    words = 0
+    chars = 0
+    in_word = False  # previous chunk ended inside a word
+
+    # Text mode: universal newlines turn the CRLF content.md gets on Windows
+    # into '\n', and the decoder carries UTF-8 sequences split across blocks
+    with open(content_file, 'r', encoding='utf-8', errors='replace') as f:
+        while True:
+            text = f.read(STREAM_CHUNK_SIZE)
+            if not text:
+                break
+            lines += text.count('\n')
+            # Words are counted on the decoded text so str.split()'s Unicode whitespace
+            # (U+3000, NBSP, ...) separates them; a word cut at the chunk boundary counts once
+            words += len(text.split())
+            if in_word and not text[0].isspace():
+                words -= 1
+            in_word = not text[-1].isspace()
+            chars += len(text)
+            yield _dumps(text)[1:-1]
+
+    stats = {
+        "lines": lines,
+        "words": words,
+        "characters": chars,
+        "size_kb": round(chars / 1024, 2)
+    }
+    yield b'","stats":' + _dumps(stats) + b'}'
+
+
+async def _read_listing_files_async(
+    filename: str,
+    content_path: Optional[str],
+    metadata_path: Optional[str],
+    include_preview: bool = True
+) -> Tuple[str, float, Optional[Dict[str, Any]]]:
+    """Run _read_listing_files in a worker thread, bounded by the listing I/O semaphore."""
+    async with _listing_io_semaphore:
+        return await asyncio.to_thread(
+            _read_listing_files, filename, content_path, metadata_path, include_preview
+        )
+
+
+def _build_listing_payload(
+    rows: List[Tuple[Any, Any, str]],
+    file_results: List[Tuple[str, float, Optional[Dict[str, Any]]]]
+) -> Tuple[int, bytes]:
+    """
+    Assemble the /parsed-documents rows and serialize the response body.
+
+    CPU-bound (row dicts + JSON encoding); list_parsed_documents runs it in a worker thread.
+
+    Returns:
+        (number of documents, JSON bytes)
+    """
+    parsed_docs = []
+    # A document appears once per version; convert its timestamps only once
+    document_timestamps: Dict[int, Tuple[Optional[float], Optional[float], Optional[float]]] = {}
 
-    if "dolphin" in strategy_lower:
-        return "dolphin"
-    elif "mineru" in strategy_lower:
-        return "mineru"
-    elif "remote" in strategy_lower and "ocr" in strategy_lower:
-        return "remote_ocr"
-    elif "camelot" in strategy_lower and "docling" not in strategy_lower:
-        return "camelot"
-    else:
-        return "docling"
+    for (history, document, parser_used), (preview, content_size_kb, parsing_metadata) in zip(rows, file_results):
+        # Get table count for this specific version
+        table_count = history.json_tables or 0
+        picture_count = history.total_images or 0
+
+        # If no metadata file, generate from options_json
+        if not parsing_metadata and history.options_json:
+            try:
+                options = _loads(history.options_json)
+                parsing_metadata = _db_metadata(parser_used, options)
+            except Exception as e:
+                logger.error(f"Error parsing options_json: {str(e)}")
+
+        timestamps = document_timestamps.get(document.id)
+        if timestamps is None:
+            timestamps = document_timestamps[document.id] = (
+                document.created_at.timestamp() if document.created_at else None,
+                document.updated_at.timestamp() if document.updated_at else None,
+                document.last_parsed_at.timestamp() if document.last_parsed_at else None,
+            )
+        created_ts, updated_ts, last_parsed_ts = timestamps
+
+        # Build response object
+        parsed_docs.append({
+            # Primary display fields
+            "filename": document.filename,  # Original filename as title
+            "document_name": _stem(document.filename),  # Name without extension
+
+            # Version info (NEW)
+            "version_folder": history.version_folder,
+            "version_id": history.id,
+            "is_latest": history.is_latest,
+
+            # Database metadata
+            "id": history.id,  # Parsing History ID (unique across all versions)
+            "document_id": document.id,  # Document ID (same for all versions of same file)
+            "file_extension": document.file_extension,
+            "file_size": document.file_size,  # Original file size in bytes
+            "total_pages": document.total_pages,
+            "parsing_status": history.parsing_status,
+            "parsing_strategy": history.parsing_strategy,
+            "created_at": created_ts,
+            "updated_at": updated_ts,
+            "last_parsed_at": last_parsed_ts,
+            "parsed_at": history.created_at.timestamp() if history.created_at else None,
+            "duration_seconds": history.duration_seconds,
+
+            # Version-specific counts
+            "chunk_count": 0,  # Chunk is not used
+            "table_count": table_count,
+            "picture_count": picture_count,
+
+            # File metadata
+            "size_kb": content_size_kb,  # Parsed content file size
+            "preview": preview,
+            "output_dir": history.output_dir,
+
+            # Parsing metadata
+            "parsing_metadata": parsing_metadata,
+        })
+
+    # Serialized once here (FastAPI skips jsonable_encoder) and kept for cache hits
+    payload = _dumps({
+        "total": len(parsed_docs),
+        "documents": parsed_docs
+    })
+    return len(parsed_docs), payload
+
+
+def _completed_history_signature(db: Session) -> Tuple[int, Optional[int]]:
+    """
+    (count, max id) of completed parsing histories.
+
+    Every finished parse inserts a new history row and document deletes cascade
+    to their histories, so any change to the listing changes this signature.
+    """
+    return db.query(
+        func.count(db_models.ParsingHistory.id),
+        func.max(db_models.ParsingHistory.id)
+    ).filter(db_models.ParsingHistory.parsing_status == "completed").one()
 
 
-@router.get("/parsed-documents")
+@router.get("/parsed-documents", response_class=_JSONResponse)
 async def list_parsed_documents(
     db: Session = Depends(get_db),
-    show_all_versions: bool = True  # Show all parsing versions by default
+    show_all_versions: bool = True,  # Show all parsing versions by default
+    limit: int = 100,
+    preview: bool = True,
+    name_prefix: Optional[str] = None
 ):
     """
     List all parsed documents from database with version support.
 
     Args:
         show_all_versions: If True, show all parsing versions. If False, show only latest version per document.
+        limit: Maximum number of most recent parsing results to return.
+            Applied in SQL (ORDER BY created_at DESC LIMIT), so only the top entries
+            are loaded and no preview files are read for older entries.
+        preview: If False, skip reading preview text (rows get an empty "preview").
+        name_prefix: Only include documents whose filename starts with this prefix.
+            Filtered in SQL, so no files are read for other documents.
     """
-    logger.info("=" * 80)
-    logger.info("🔵 RESULTS.PY CODE VERSION: 2025-11-05 VERSION-AWARE LISTING")
-    logger.info("=" * 80)
+    logger.debug("=" * 80)
+    logger.debug("🔵 RESULTS.PY CODE VERSION: 2025-11-05 VERSION-AWARE LISTING")
+    logger.debug("=" * 80)
     try:
-        from app import db_models
+        # Serve a recently built payload if no parse has completed or been deleted since
+        cache_key = (show_all_versions, limit, preview, name_prefix)
+        signature = tuple(await asyncio.to_thread(_completed_history_signature, db))
+        if signature[0] == 0:
+            # Nothing parsed yet: skip the listing query and serialization entirely
+            return Response(content=_EMPTY_LISTING_PAYLOAD, media_type="application/json")
+        cached = _listing_cache.get(cache_key)
+        if cached and cached[1] == signature and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            logger.info("✅ Returning cached parsing results listing")
+            return Response(content=cached[2], media_type="application/json")
 
         # Query parsing histories with completed status
+        # Documents are loaded in the same query (JOIN) to avoid one lookup per history row,
+        # fetching only the columns rendered below; parser_used is derived from parsing_strategy in SQL
+        Document = db_models.Document
+        query = db.query(db_models.ParsingHistory, _parser_used_column()).options(
+            joinedload(db_models.ParsingHistory.document).load_only(
+                Document.id,
+                Document.filename,
+                Document.file_extension,
+                Document.file_size,
+                Document.total_pages,
+                Document.created_at,
+                Document.updated_at,
+                Document.last_parsed_at,
+            )
+        )
         if show_all_versions:
             # Show all completed parsing attempts
-            query = db.query(db_models.ParsingHistory).filter(
+            query = query.filter(
                 db_models.ParsingHistory.parsing_status == "completed"
-            ).order_by(db_models.ParsingHistory.created_at.desc())
+            ).order_by(db_models.ParsingHistory.created_at.desc(), db_models.ParsingHistory.id.desc())
         else:
             # Show only latest version per document
-            query = db.query(db_models.ParsingHistory).filter(
+            query = query.filter(
                 db_models.ParsingHistory.parsing_status == "completed",
                 db_models.ParsingHistory.is_latest == True
-            ).order_by(db_models.ParsingHistory.created_at.desc())
+            ).order_by(db_models.ParsingHistory.created_at.desc(), db_models.ParsingHistory.id.desc())
 
-        parsing_histories = query.limit(100).all()
+        if name_prefix:
+            query = query.filter(
+                db_models.ParsingHistory.document.has(
+                    Document.filename.startswith(name_prefix, autoescape=True)
+                )
+            )
 
-        logger.info(f"📊 Found {len(parsing_histories)} parsing histories (show_all_versions={show_all_versions})")
+        # Blocking DB round trip runs in a worker thread so the event loop stays free
+        parsing_histories = await asyncio.to_thread(query.limit(limit).all)
 
-        parsed_docs = []
+        logger.info(f"📊 Found {len(parsing_histories)} parsing histories (show_all_versions={show_all_versions}, limit={limit})")
 
-        for history in parsing_histories:
-            # Get associated document
-            document = crud.get_document_by_id(db, history.document_id)
-            if not document:
-                continue
+        # Pair each history with its document (eager-loaded above)
+        rows = [
+            (history, history.document, parser_used)
+            for history, parser_used in parsing_histories
+            if history.document
+        ]
 
-            # Get table count for this specific version
-            table_count = history.json_tables or 0
-            picture_count = history.total_images or 0
-
-            # Get file preview if content file exists
-            preview = ""
-            content_size_kb = 0
-
-            if history.content_path:
-                content_file = Path(history.content_path)
-                if content_file.exists():
-                    try:
-                        # Read first few lines for preview
-                        with open(content_file, 'r', encoding='utf-8') as f:
-                            content = f.read(500)  # Read first 500 chars
-                            preview = content[:200] + "..." if len(content) > 200 else content
-
-                        # Get actual file size
-                        stat = content_file.stat()
-                        content_size_kb = round(stat.st_size / 1024, 2)
-                    except Exception as e:
-                        logger.error(f"Error reading content file for {document.filename}: {str(e)}")
-
-            # Load parsing metadata if available
-            parsing_metadata = None
-            if history.metadata_path and Path(history.metadata_path).exists():
-                try:
-                    with open(history.metadata_path, 'r', encoding='utf-8') as mf:
-                        parsing_metadata = json.load(mf)
-                except Exception as e:
-                    logger.error(f"Error loading metadata for {document.filename}: {str(e)}")
-
-            # If no metadata file, generate from options_json
-            if not parsing_metadata and history.options_json:
-                try:
-                    options = json.loads(history.options_json)
-                    parsing_metadata = {
-                        "parser_used": _map_strategy_to_parser(history.parsing_strategy),
-                        "table_parser": options.get("table_parser"),
-                        "ocr_enabled": options.get("do_ocr", False),
-                        "ocr_engine": options.get("ocr_engine"),
-                        "output_format": options.get("output_format", "markdown"),
-                        "picture_description_enabled": options.get("do_picture_description", False),
-                        "auto_image_analysis_enabled": options.get("auto_image_analysis", False)
-                    }
-                except Exception as e:
-                    logger.error(f"Error parsing options_json: {str(e)}")
-
-            # Build response object
-            parsed_docs.append({
-                # Primary display fields
-                "filename": document.filename,  # Original filename as title
-                "document_name": Path(document.filename).stem,  # Name without extension
-
-                # Version info (NEW)
-                "version_folder": history.version_folder,
-                "version_id": history.id,
-                "is_latest": history.is_latest,
-
-                # Database metadata
-                "id": history.id,  # Parsing History ID (unique across all versions)
-                "document_id": document.id,  # Document ID (same for all versions of same file)
-                "file_extension": document.file_extension,
-                "file_size": document.file_size,  # Original file size in bytes
-                "total_pages": document.total_pages,
-                "parsing_status": history.parsing_status,
-                "parsing_strategy": history.parsing_strategy,
-                "created_at": document.created_at.timestamp() if document.created_at else None,
-                "updated_at": document.updated_at.timestamp() if document.updated_at else None,
-                "last_parsed_at": document.last_parsed_at.timestamp() if document.last_parsed_at else None,
-                "parsed_at": history.created_at.timestamp() if history.created_at else None,
-                "duration_seconds": history.duration_seconds,
-
-                # Version-specific counts
-                "chunk_count": 0,  # Chunk is not used
-                "table_count": table_count,
-                "picture_count": picture_count,
-
-                # File metadata
-                "size_kb": content_size_kb,  # Parsed content file size
-                "preview": preview,
-                "output_dir": history.output_dir,
-
-                # Parsing metadata
-                "parsing_metadata": parsing_metadata,
-            })
-
-        logger.info(f"✅ Returning {len(parsed_docs)} parsing results with version info")
-
-        return {
-            "total": len(parsed_docs),
-            "documents": parsed_docs
-        }
+        # Read previews and metadata files concurrently off the event loop
+        file_results = await asyncio.gather(*[
+            _read_listing_files_async(document.filename, history.content_path, history.metadata_path, preview)
+            for history, document, _ in rows
+        ])
+
+        # Row assembly and JSON encoding run in a worker thread so the event loop stays free
+        doc_count, payload = await asyncio.to_thread(_build_listing_payload, rows, file_results)
+
+        logger.info(f"✅ Returning {doc_count} parsing results with version info")
+
+        if len(_listing_cache) >= LISTING_CACHE_MAX_ENTRIES:
+            _listing_cache.clear()
+        _listing_cache[cache_key] = (time.monotonic(), signature, payload)
+
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error listing parsed documents: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/result/{filename}")
-async def get_parse_result(filename: str, db: Session = Depends(get_db)):
-    """Get parsing result for a previously parsed document"""
+@router.get("/result/{filename}", response_class=_JSONResponse)
+def get_parse_result(filename: str, request: Request, db: Session = Depends(get_db)) -> Response:
+    """
+    Get parsing result for a previously parsed document
+
+    Plain def: all work here is blocking file and DB I/O, so FastAPI runs it
+    in its threadpool instead of on the event loop.
+    """
     try:
         # Remove extension from filename to get document name
         # Only remove extension if it's a known document type
         file_path = Path(filename)
-        known_extensions = {'.pdf', '.docx', '.pptx', '.html', '.txt', '.md'}
-
-        if file_path.suffix.lower() in known_extensions:
+        if file_path.suffix.lower() in KNOWN_EXTENSIONS:
             doc_name = file_path.stem
         else:
             # No known extension, use the full filename
             doc_name = filename
 
-        # Try to get document from database first
-        db_doc = crud.get_document_by_filename(db, filename)
+        # Try to get document from database first. The filename as-is and the
+        # doc_name + extension candidates used by the metadata fallback are fetched in one query.
+        fallback_filenames = [doc_name + ext for ext in FALLBACK_EXTENSIONS]
+        db_docs = crud.get_document_lookup_by_filenames(db, [filename] + fallback_filenames)
+        db_doc = db_docs.get(filename)
 
         # Find content file path
         content_file = None
@@ -213,91 +555,98 @@ async def get_parse_result(filename: str, db: Session = Depends(get_db)):
 
         # Strategy 3: Find latest version folder (new structure)
         if not content_file and doc_output_dir.exists():
-            version_folders = [d for d in doc_output_dir.iterdir() if d.is_dir()]
-            if version_folders:
-                # Sort by modification time (newest first)
-                version_folders.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-                for version_folder in version_folders:
-                    content_candidate = version_folder / "content.md"
-                    if content_candidate.exists():
-                        content_file = content_candidate
-                        doc_output_dir = version_folder  # Update to version folder
-                        break
-
-        if not content_file or not content_file.exists():
+            # DirEntry.is_dir() uses the cached d_type, so only the mtime sort stats each folder
+            with os.scandir(doc_output_dir) as entries:
+                version_folders = [e for e in entries if e.is_dir(follow_symlinks=False)]
+            # Sort by modification time (newest first)
+            version_folders.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+            for version_folder in version_folders:
+                content_candidate = Path(version_folder.path) / "content.md"
+                if content_candidate.exists():
+                    content_file = content_candidate
+                    doc_output_dir = Path(version_folder.path)  # Update to version folder
+                    break
+
+        # Every strategy above only sets content_file after checking it exists
+        if not content_file:
             raise HTTPException(status_code=404, detail=f"Parsed result not found for {filename}")
 
-        # Read content
-        with open(content_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Calculate statistics
-        lines = content.count('\n') + 1
-        words = len(content.split())
-        chars = len(content)
+        tables_dir = doc_output_dir / "tables"
+        try:
+            tables_mtime_ns = os.stat(tables_dir).st_mtime_ns
+        except FileNotFoundError:
+            tables_mtime_ns = None
+        metadata_file = doc_output_dir / "metadata.json"
+        try:
+            metadata_mtime_ns = os.stat(metadata_file).st_mtime_ns
+        except FileNotFoundError:
+            metadata_mtime_ns = None
+
+        # The body is built from content.md, tables/ and metadata.json (which a parse
+        # writes after committing, so the DB fallback can be served before it exists);
+        # the ETag covers all three and the browser revalidates on every fetch
+        content_stat = content_file.stat()
+        etag_parts = (
+            zlib.crc32(str(content_file).encode()),
+            content_stat.st_mtime_ns,
+            content_stat.st_size,
+            tables_mtime_ns or 0,
+            metadata_mtime_ns or 0
+        )
+        etag = '"' + '-'.join(f"{part:x}" for part in etag_parts) + '"'
+        cache_headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=cache_headers)
 
         # Check for table summary (if exists)
         table_summary = None
-        tables_dir = doc_output_dir / "tables"
-        if tables_dir.exists():
-            json_tables = list(tables_dir.glob("table_*.json"))
-            csv_tables = list(tables_dir.glob("table_*.csv"))
-            md_tables = list(tables_dir.glob("table_*.md"))
+
+        if tables_mtime_ns is not None:
+            json_table_ids, csv_count, md_count = _scan_tables_dir(str(tables_dir), tables_mtime_ns)
 
             table_summary = {
-                "total_tables": len(json_tables),
-                "json_tables": len(json_tables),
-                "csv_tables": len(csv_tables),
-                "markdown_tables": len(md_tables),
-                "json_table_ids": [f.stem for f in json_tables]
+                "total_tables": len(json_table_ids),
+                "json_tables": len(json_table_ids),
+                "csv_tables": csv_count,
+                "markdown_tables": md_count,
+                "json_table_ids": list(json_table_ids)
             }
 
         # Build output structure
         output_structure = {
             "output_dir": str(doc_output_dir),
             "content_file": str(content_file),
-            "tables_dir": str(tables_dir) if tables_dir.exists() else None
+            "tables_dir": str(tables_dir) if tables_mtime_ns is not None else None
         }
 
         # Load parsing metadata if available
         parsing_metadata = None
-        metadata_file = doc_output_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata_dict = json.load(f)
-                    parsing_metadata = ParsingMetadata(**metadata_dict)
+        # _load_metadata stats the file itself and returns None when it is missing
+        metadata_found = True
+        try:
+            metadata_dict = _load_metadata(metadata_file)
+            if metadata_dict is None:
+                metadata_found = False
+            else:
+                parsing_metadata = ParsingMetadata(**metadata_dict)
                 logger.info(f"📄 Loaded parsing metadata from {metadata_file}")
-            except Exception as e:
-                logger.error(f"Error loading metadata.json: {str(e)}", exc_info=True)
-        else:
+        except Exception as e:
+            logger.error(f"Error loading metadata.json: {str(e)}", exc_info=True)
+
+        if not metadata_found:
             # Fallback to database if metadata.json doesn't exist
             try:
                 logger.info(f"🔍 Trying to load metadata from database for {filename}")
-                db_doc = None
-
-                # Try with filename as-is first
-                db_doc = crud.get_document_by_filename(db, filename)
-
-                # If not found, try adding common extensions (doc_name might not have extension)
+                # If not found by filename as-is, try adding common extensions (doc_name might not have extension)
                 if not db_doc:
-                    for ext in ['.pdf', '.docx', '.pptx', '.html', '.txt']:
-                        filename_with_ext = doc_name + ext
-                        db_doc = crud.get_document_by_filename(db, filename_with_ext)
-                        if db_doc:
-                            logger.info(f"✓ Found document in DB with extension {ext}")
-                            break
+                    db_doc = next((db_docs[name] for name in fallback_filenames if name in db_docs), None)
+                    if db_doc:
+                        logger.info(f"✓ Found document in DB as {db_doc.filename}")
 
                 if db_doc and db_doc.parsing_strategy:
                     # Create metadata from database info
                     parsing_metadata = ParsingMetadata(
-                        parser_used=_map_strategy_to_parser(db_doc.parsing_strategy),
-                        table_parser=None,
-                        ocr_enabled=False,
-                        ocr_engine=None,
-                        output_format="markdown",
-                        picture_description_enabled=False,
-                        auto_image_analysis_enabled=False
+                        **_db_metadata(_map_strategy_to_parser(db_doc.parsing_strategy))
                     )
                     logger.info(f"📊 Generated metadata from database for {filename}: parser={parsing_metadata.parser_used}")
                 else:
@@ -305,21 +654,25 @@ async def get_parse_result(filename: str, db: Session = Depends(get_db)):
             except Exception as e:
                 logger.error(f"❌ Error loading metadata from DB: {str(e)}", exc_info=True)
 
-        return ParseResponse(
-            success=True,
-            filename=filename,
-            markdown=content,
-            stats={
-                "lines": lines,
-                "words": words,
-                "characters": chars,
-                "size_kb": round(chars / 1024, 2)
-            },
-            saved_to=str(content_file),
-            output_format="markdown",
-            table_summary=table_summary,
-            output_structure=output_structure,
-            parsing_metadata=parsing_metadata
+        # ParseResponse fields as a plain dict (no model validation or encoder pass);
+        # markdown and stats are filled in by _stream_parse_result while content.md is streamed
+        envelope = {
+            "success": True,
+            "filename": filename,
+            "saved_to": str(content_file),
+            "error": None,
+            "output_format": "markdown",
+            "table_summary": table_summary,
+            "output_structure": output_structure,
+            "pictures_summary": None,
+            "warnings": None,
+            "parsing_metadata": parsing_metadata.model_dump() if parsing_metadata else None
+        }
+
+        return StreamingResponse(
+            _stream_parse_result(content_file, envelope),
+            media_type="application/json",
+            headers=cache_headers
         )
 
     except HTTPException:
@@ -11,16 +11,30 @@ Strategy:
 Author: Implementation based on user requirements
 """
 
-from typing import List, Dict, Optional, Tuple, Set
+from typing import Iterator, List, Dict, Optional, Tuple, Set
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import logging
 from dataclasses import dataclass
 import pandas as pd
 import warnings
 import os
+import re
+import json
+import hashlib
+import pickle
+import tempfile
+import time
+import multiprocessing
+
+# Defined before the optional imports below, which log when a fallback is unavailable
+logger = logging.getLogger(__name__)
 
 try:
     import camelot
+    # Load the parser modules now rather than on the first read_pdf call, so
+    # worker processes preloaded from this module start warm
+    import camelot.parsers  # noqa: F401
     # Suppress Camelot debug logs
     import cv2
     cv2.setLogLevel(0)  # Suppress OpenCV logs
@@ -43,10 +57,33 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
+# orjson for fast table JSON saves (stdlib json fallback)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# xxhash (xxh3, SIMD) for PDF content hashing; stdlib BLAKE2b fallback is still far faster than SHA-256
+try:
+    import xxhash
+    _new_content_hash = xxhash.xxh3_128
+except ImportError:
+    xxhash = None
+    _new_content_hash = lambda: hashlib.blake2b(digest_size=16)
+
+# pypdf is only used to count pages when fanning 'all' pages out to worker processes
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+from .config import OUTPUT_FOLDER
+
 # pdfplumber import for fallback (Phase 1 improvement)
 try:
     from .pdfplumber_extractor import (
         extract_table_from_region,
+        extract_tables_from_regions,
         validate_pdfplumber_available,
         PdfPlumberTableExtraction
     )
@@ -55,7 +92,48 @@ except ImportError:
     PDFPLUMBER_AVAILABLE = False
     logger.warning("⚠️ pdfplumber not available. Install with: pip install pdfplumber")
 
-logger = logging.getLogger(__name__)
+# Worker processes for per-page Camelot extraction (1 = run camelot.read_pdf in-process)
+CAMELOT_MAX_WORKERS = int(os.getenv("CAMELOT_MAX_WORKERS", str(min(os.cpu_count() or 1, 4))))
+
+# Page workers are forked from a forkserver that has already imported this module
+# (and with it camelot/cv2/pdfminer), so each worker starts warm without forking
+# the threaded API process itself. Platforms without forkserver use their default.
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    _POOL_CONTEXT = multiprocessing.get_context('forkserver')
+    _POOL_CONTEXT.set_forkserver_preload([__name__])
+else:
+    _POOL_CONTEXT = None
+
+# Content-addressed cache for extract_tables_hybrid results (bypass with CAMELOT_CACHE_DISABLE=true)
+CAMELOT_CACHE_DISABLE = os.getenv("CAMELOT_CACHE_DISABLE", "False").lower() in ("true", "1", "yes")
+CAMELOT_CACHE_DIR = OUTPUT_FOLDER / ".camelot_cache"
+_CAMELOT_CACHE_VERSION = 1  # bump when the cached extraction format changes
+# Eviction bounds, applied after each write: entries not used for MAX_AGE_DAYS go
+# first, then the least recently used until the folder fits in MAX_MB
+CAMELOT_CACHE_MAX_AGE_DAYS = float(os.getenv("CAMELOT_CACHE_MAX_AGE_DAYS", "30"))
+CAMELOT_CACHE_MAX_MB = float(os.getenv("CAMELOT_CACHE_MAX_MB", "512"))
+
+# Corrupted Korean date patterns, combined so validate_table_text_order scans the text once
+_CORRUPTED_RE = re.compile(
+    r'\)\s*[월화수목금토일]\s+\d+'            # ") 수 10" (removed trailing '.')
+    r'|\d+\s*일\s*[월화수목금토일]'             # "14일화" (removed trailing '\(')
+    r'|\d+\.\d+\s*\(\s*\)\s*[월화수목금토일]'   # "2.4( ) 화"
+    r'|\(\s*\)\s*[월화수목금토일]'              # "( ) 화"
+)
+_WS_RE = re.compile(r'\s+')
+_WEEKDAY_RE = re.compile(r'[월화수목금토일]')
+
+# Cell text that round-trips exactly through an int64 (no leading zeros/sign/separators)
+_CANONICAL_INT_RE = re.compile(r'-?(?:0|[1-9]\d{0,17})')
+
+# One comma-separated part of a page spec: "3" or "1-5"
+_PAGE_SPEC_PART_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+)\s*)?')
+
+# Camelot column labels are ints (need NON_STR_KEYS); bbox/report values may be NumPy scalars
+if orjson:
+    _ORJSON_SAVE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+# orjson >= 3.9 embeds pre-serialized JSON (DataFrame.to_json rows) without re-parsing
+_ORJSON_FRAGMENT = getattr(orjson, 'Fragment', None)
 
 
 @dataclass
@@ -71,8 +149,8 @@ class CamelotTableExtraction:
     # Geometry information
     bbox: Tuple[float, float, float, float]  # (x1, y1, x2, y2)
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary format"""
+    def _metadata_dict(self) -> Dict:
+        """Table fields without cell data or parsing report (see to_dict)."""
         return {
             "table_id": self.table_id,
             "page": self.page,
@@ -82,11 +160,33 @@ class CamelotTableExtraction:
             "shape": {
                 "rows": len(self.dataframe),
                 "cols": len(self.dataframe.columns)
-            },
-            "data": self.dataframe.to_dict(orient='records'),
-            "parsing_report": self.parsing_report
+            }
         }
 
+    def to_dict(self) -> Dict:
+        """Convert to dictionary format"""
+        result = self._metadata_dict()
+        result["data"] = self.dataframe.to_dict(orient='records')
+        result["parsing_report"] = self.parsing_report
+        return result
+
+    def optimize_dtypes(self) -> None:
+        """
+        Store integer-only columns as compact integer dtypes instead of Python strings.
+
+        Only columns whose every cell is a canonical integer ("12", "-3"; no
+        leading zeros, separators or blanks) are converted, so str(cell) and
+        Markdown/CSV output stay exactly the same as the extracted text.
+        """
+        df = self.dataframe
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            if column.empty or not pd.api.types.is_string_dtype(column):
+                continue
+            if not column.str.fullmatch(_CANONICAL_INT_RE).eq(True).all():
+                continue
+            df.isetitem(position, pd.to_numeric(column, downcast='integer'))
+
     def to_markdown(self) -> str:
         """Convert table to Markdown format"""
         return self.dataframe.to_markdown(index=False)
@@ -96,6 +196,299 @@ class CamelotTableExtraction:
         return self.dataframe.to_html(index=False, escape=False)
 
 
+@dataclass
+class _PageTable:
+    """Camelot table rebuilt from a worker process result (same attributes the extract loops read)"""
+    page: int
+    accuracy: float
+    parsing_report: Dict
+    _bbox: Tuple[float, float, float, float]
+    df: pd.DataFrame
+
+
+def _extract_one_page(pdf_path: str, page_num: int, camelot_kwargs: Dict) -> List[Tuple]:
+    """
+    Run Camelot on a single page. Executed in a worker process.
+
+    Returns plain (page, accuracy, parsing_report, bbox, columns, values) tuples
+    so results pickle cheaply instead of shipping Camelot/pandas objects.
+    """
+    tables = camelot.read_pdf(pdf_path, **{**camelot_kwargs, 'pages': str(page_num)})
+    return [
+        (
+            table.page,
+            table.accuracy if hasattr(table, 'accuracy') else 0.0,
+            table.parsing_report if hasattr(table, 'parsing_report') else {},
+            table._bbox if hasattr(table, '_bbox') else (0, 0, 0, 0),
+            table.df.columns.tolist(),
+            table.df.values.tolist()
+        )
+        for table in tables
+    ]
+
+
+def _resolve_page_list(pdf_path: Path, pages: str) -> Optional[List[int]]:
+    """Concrete page numbers for a Camelot page spec, or None if they cannot be determined."""
+    if pages == 'all':
+        if PdfReader is None:
+            return None
+        try:
+            return list(range(1, len(PdfReader(str(pdf_path)).pages) + 1))
+        except Exception as e:
+            logger.debug(f"Could not count pages of {pdf_path.name}: {e}")
+            return None
+    try:
+        return sorted(parse_page_spec(pages))
+    except ValueError:
+        # Specs such as "1-end" are left to Camelot
+        return None
+
+
+def _read_pdf_tables(pdf_path: Path, camelot_kwargs: Dict) -> list:
+    """
+    camelot.read_pdf, fanned out one page per task over a process pool.
+
+    Pages are independent and CPU-bound (Ghostscript rasterization, OpenCV line
+    detection), so multi-page specs are split across CAMELOT_MAX_WORKERS processes.
+    Falls back to a single in-process call for one page, one worker, or when the
+    page list cannot be resolved. Tables are returned in page order.
+    """
+    page_list = None
+    if CAMELOT_MAX_WORKERS > 1:
+        page_list = _resolve_page_list(pdf_path, camelot_kwargs.get('pages', 'all'))
+
+    if not page_list or len(page_list) < 2:
+        return list(camelot.read_pdf(str(pdf_path), **camelot_kwargs))
+
+    results = {}
+    with ProcessPoolExecutor(
+        max_workers=min(CAMELOT_MAX_WORKERS, len(page_list)),
+        mp_context=_POOL_CONTEXT
+    ) as executor:
+        futures = {
+            executor.submit(_extract_one_page, str(pdf_path), page_num, camelot_kwargs): page_num
+            for page_num in page_list
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    tables = []
+    for page_num in page_list:
+        for page, accuracy, parsing_report, bbox, columns, values in results[page_num]:
+            tables.append(_PageTable(
+                page=page,
+                accuracy=accuracy,
+                parsing_report=parsing_report,
+                _bbox=bbox,
+                df=pd.DataFrame(values, columns=columns)
+            ))
+    return tables
+
+
+def _hybrid_cache_path(pdf_path: Path, pages: str, threshold: float, kwargs: Dict) -> Optional[Path]:
+    """Cache file for a hybrid extraction, keyed on PDF content and extraction parameters."""
+    if CAMELOT_CACHE_DISABLE:
+        return None
+    try:
+        content_hash = _new_content_hash()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                content_hash.update(chunk)
+    except OSError:
+        return None
+    params = repr((_CAMELOT_CACHE_VERSION, pages, threshold, sorted(kwargs.items())))
+    params_hash = hashlib.blake2b(params.encode(), digest_size=8).hexdigest()
+    return CAMELOT_CACHE_DIR / f"{content_hash.hexdigest()}_{params_hash}.pkl"
+
+
+def _load_cached_extraction(cache_path: Path) -> Optional[Tuple[List[CamelotTableExtraction], Dict]]:
+    """Load a cached (extractions, summary) pair, or None on miss/corruption."""
+    try:
+        with open(cache_path, 'rb') as f:
+            result = pickle.load(f)
+        # Refresh the mtime so eviction treats it as recently used
+        os.utime(cache_path)
+        return result
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable Camelot cache {cache_path.name}: {e}")
+        return None
+
+
+def _store_cached_extraction(cache_path: Path, result: Tuple[List[CamelotTableExtraction], Dict]) -> None:
+    """Write (extractions, summary) atomically; cache failures never fail extraction."""
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name per write, so concurrent writers never share a file
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix='.tmp', delete=False) as f:
+            tmp_name = f.name
+            pickle.dump(result, f, protocol=5)
+        os.replace(tmp_name, cache_path)
+        tmp_name = None
+    except Exception as e:
+        logger.warning(f"⚠️ Could not write Camelot cache {cache_path.name}: {e}")
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    _prune_cache(cache_path.parent)
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Evict stale and least recently used cache entries beyond the age/size bounds."""
+    try:
+        entries = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False) and entry.name.endswith('.pkl'):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+
+    # Oldest first: expired entries, then LRU order until the total fits
+    entries.sort()
+    cutoff = time.time() - CAMELOT_CACHE_MAX_AGE_DAYS * 86400
+    total = sum(size for _, size, _ in entries)
+    max_bytes = CAMELOT_CACHE_MAX_MB * 1024 * 1024
+    removed = 0
+    for mtime, size, path in entries:
+        if mtime >= cutoff and total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"🧹 Evicted {removed} Camelot cache entries")
+
+
+# Default LATTICE parameters for high accuracy (optimized for Korean PDFs)
+_LATTICE_DEFAULTS = {
+    'line_scale': 40,  # Sensitivity for line detection (default: 15, optimized: 40)
+    'line_tol': 3,  # Line tolerance for incomplete lines (default: 2, optimized: 3 for Korean PDFs)
+    'joint_tol': 3,  # Joint tolerance for intersection detection (default: 2, optimized: 3 for merged cells)
+    'resolution': 400,  # Image resolution for better Korean character recognition (default: 300, optimized: 400)
+    'shift_text': ['l', 't'],  # Shift text to left/top for better alignment
+    'copy_text': ['v'],  # Copy text vertically for merged cells
+    'split_text': True,  # Split text that spans across multiple cells (Phase 1 improvement)
+    'strip_text': ' .\n',  # Remove spaces, dots, newlines to prevent text order corruption
+    'suppress_stdout': True,  # Suppress Camelot stdout
+}
+
+# Default STREAM parameters
+_STREAM_DEFAULTS = {
+    'edge_tol': 50,  # Edge tolerance for table detection
+    'row_tol': 2,    # Row tolerance for grouping
+    'column_tol': 0,  # Column tolerance
+    'split_text': True,  # Split text that spans across multiple cells (Phase 1 improvement)
+    'strip_text': ' .\n',  # Remove spaces, dots, newlines to prevent text order corruption
+    'suppress_stdout': True,  # Suppress Camelot stdout
+}
+
+_FLAVOR_DEFAULTS = {'lattice': _LATTICE_DEFAULTS, 'stream': _STREAM_DEFAULTS}
+_FLAVOR_ICONS = {'lattice': "🔍", 'stream': "🔄"}
+
+
+def _iter_tables(
+    pdf_path: Path,
+    flavor: str,
+    pages: str = 'all',
+    **kwargs
+) -> Iterator[CamelotTableExtraction]:
+    """
+    Yield tables extracted with the given Camelot flavor ('lattice' or 'stream').
+
+    Camelot returns all tables of a run at once, but yielding them lets
+    consumers (saving, validation) start on the first table instead of
+    waiting for the whole list to be wrapped.
+    """
+    if camelot is None:
+        raise ImportError("Camelot not installed. Install with: pip install camelot-py[cv]")
+
+    camelot_kwargs = {
+        'flavor': flavor,
+        'pages': pages,
+        **_FLAVOR_DEFAULTS[flavor],
+        **kwargs
+    }
+
+    for idx, table in enumerate(_read_pdf_tables(pdf_path, camelot_kwargs)):
+        yield CamelotTableExtraction(
+            table_id=f"table_{idx+1:03d}",
+            page=table.page,
+            dataframe=table.df,
+            accuracy=getattr(table, 'accuracy', 0.0),
+            parsing_report=getattr(table, 'parsing_report', {}),
+            extraction_mode=flavor,
+            bbox=getattr(table, '_bbox', (0, 0, 0, 0))
+        )
+
+
+def _extract_tables(
+    pdf_path: Path,
+    flavor: str,
+    pages: str = 'all',
+    **kwargs
+) -> Tuple[List[CamelotTableExtraction], Set[int]]:
+    """
+    Extract tables with the given Camelot flavor ('lattice' or 'stream').
+
+    Camelot errors are logged and produce an empty result.
+    """
+    if camelot is None:
+        raise ImportError("Camelot not installed. Install with: pip install camelot-py[cv]")
+
+    label = flavor.upper()
+
+    try:
+        tables = _iter_tables(pdf_path, flavor, pages=pages, **kwargs)
+
+        # Use tqdm for progress if available
+        if TQDM_AVAILABLE:
+            extractions = []
+            pbar = tqdm(tables, desc=f"{_FLAVOR_ICONS[flavor]} {label}: {pdf_path.name}", unit="table", leave=False)
+            for extraction in pbar:
+                extractions.append(extraction)
+                pbar.set_postfix({"page": extraction.page, "acc": f"{extraction.accuracy:.2%}"})
+        else:
+            extractions = list(tables)
+
+        successful_pages = {extraction.page for extraction in extractions}
+
+        logger.info(f"✅ {label}: {len(extractions)} tables on {len(successful_pages)} pages")
+        return extractions, successful_pages
+
+    except Exception as e:
+        logger.error(f"❌ {label} extraction failed: {str(e)}")
+        return [], set()
+
+
+def iter_tables_with_lattice(
+    pdf_path: Path,
+    pages: str = 'all',
+    **kwargs
+) -> Iterator[CamelotTableExtraction]:
+    """
+    Yield tables extracted with Camelot LATTICE mode.
+
+    Args:
+        pdf_path: Path to PDF file
+        pages: Pages to process (default: 'all')
+        **kwargs: Additional Camelot parameters
+
+    Yields:
+        CamelotTableExtraction per table, in page order
+    """
+    return _iter_tables(pdf_path, 'lattice', pages=pages, **kwargs)
+
+
 def extract_tables_with_lattice(
     pdf_path: Path,
     pages: str = 'all',
@@ -117,102 +510,26 @@ def extract_tables_with_lattice(
     Returns:
         Tuple of (extracted_tables, successful_pages)
     """
-    if camelot is None:
-        raise ImportError("Camelot not installed. Install with: pip install camelot-py[cv]")
-
-    # Default LATTICE parameters for high accuracy (optimized for Korean PDFs)
-    lattice_kwargs = {
-        'flavor': 'lattice',
-        'pages': pages,
-        'line_scale': 40,  # Sensitivity for line detection (default: 15, optimized: 40)
-        'line_tol': 3,  # Line tolerance for incomplete lines (default: 2, optimized: 3 for Korean PDFs)
-        'joint_tol': 3,  # Joint tolerance for intersection detection (default: 2, optimized: 3 for merged cells)
-        'resolution': 400,  # Image resolution for better Korean character recognition (default: 300, optimized: 400)
-        'shift_text': ['l', 't'],  # Shift text to left/top for better alignment
-        'copy_text': ['v'],  # Copy text vertically for merged cells
-        'split_text': True,  # Split text that spans across multiple cells (Phase 1 improvement)
-        'strip_text': ' .\n',  # Remove spaces, dots, newlines to prevent text order corruption
-        'suppress_stdout': True,  # Suppress Camelot stdout
-        **kwargs
-    }
-
-    try:
-        # Use tqdm for progress if available
-        if TQDM_AVAILABLE:
-            desc = f"🔍 LATTICE: {pdf_path.name}"
-            with tqdm(desc=desc, unit="table", leave=False) as pbar:
-                tables = camelot.read_pdf(str(pdf_path), **lattice_kwargs)
-                pbar.total = len(tables)
-                pbar.refresh()
-
-                extractions = []
-                successful_pages = set()
-
-                for idx, table in enumerate(tables):
-                    table_id = f"table_{idx+1:03d}"
-                    page_num = table.page
-
-                    # Get accuracy score
-                    accuracy = table.accuracy if hasattr(table, 'accuracy') else 0.0
-
-                    # Get parsing report
-                    parsing_report = table.parsing_report if hasattr(table, 'parsing_report') else {}
-
-                    # Get bounding box
-                    bbox = table._bbox if hasattr(table, '_bbox') else (0, 0, 0, 0)
-
-                    extraction = CamelotTableExtraction(
-                        table_id=table_id,
-                        page=page_num,
-                        dataframe=table.df,
-                        accuracy=accuracy,
-                        parsing_report=parsing_report,
-                        extraction_mode="lattice",
-                        bbox=bbox
-                    )
-
-                    extractions.append(extraction)
-                    successful_pages.add(page_num)
-
-                    pbar.set_postfix({"page": page_num, "acc": f"{accuracy:.2%}"})
-                    pbar.update(1)
-
-                logger.info(f"✅ LATTICE: {len(extractions)} tables on {len(successful_pages)} pages")
-                return extractions, successful_pages
-        else:
-            # Fallback without tqdm
-            tables = camelot.read_pdf(str(pdf_path), **lattice_kwargs)
+    return _extract_tables(pdf_path, 'lattice', pages=pages, **kwargs)
 
-            extractions = []
-            successful_pages = set()
-
-            for idx, table in enumerate(tables):
-                table_id = f"table_{idx+1:03d}"
-                page_num = table.page
-
-                accuracy = table.accuracy if hasattr(table, 'accuracy') else 0.0
-                parsing_report = table.parsing_report if hasattr(table, 'parsing_report') else {}
-                bbox = table._bbox if hasattr(table, '_bbox') else (0, 0, 0, 0)
-
-                extraction = CamelotTableExtraction(
-                    table_id=table_id,
-                    page=page_num,
-                    dataframe=table.df,
-                    accuracy=accuracy,
-                    parsing_report=parsing_report,
-                    extraction_mode="lattice",
-                    bbox=bbox
-                )
 
-                extractions.append(extraction)
-                successful_pages.add(page_num)
+def iter_tables_with_stream(
+    pdf_path: Path,
+    pages: str = 'all',
+    **kwargs
+) -> Iterator[CamelotTableExtraction]:
+    """
+    Yield tables extracted with Camelot STREAM mode.
 
-            logger.info(f"✅ LATTICE: {len(extractions)} tables on {len(successful_pages)} pages")
-            return extractions, successful_pages
+    Args:
+        pdf_path: Path to PDF file
+        pages: Pages to process (default: 'all')
+        **kwargs: Additional Camelot parameters
 
-    except Exception as e:
-        logger.error(f"❌ LATTICE extraction failed: {str(e)}")
-        return [], set()
+    Yields:
+        CamelotTableExtraction per table, in page order
+    """
+    return _iter_tables(pdf_path, 'stream', pages=pages, **kwargs)
 
 
 def extract_tables_with_stream(
@@ -236,99 +553,7 @@ def extract_tables_with_stream(
     Returns:
         Tuple of (extracted_tables, successful_pages)
     """
-    if camelot is None:
-        raise ImportError("Camelot not installed. Install with: pip install camelot-py[cv]")
-
-    # Default STREAM parameters
-    stream_kwargs = {
-        'flavor': 'stream',
-        'pages': pages,
-        'edge_tol': 50,  # Edge tolerance for table detection
-        'row_tol': 2,    # Row tolerance for grouping
-        'column_tol': 0,  # Column tolerance
-        'split_text': True,  # Split text that spans across multiple cells (Phase 1 improvement)
-        'strip_text': ' .\n',  # Remove spaces, dots, newlines to prevent text order corruption
-        'suppress_stdout': True,  # Suppress Camelot stdout
-        **kwargs
-    }
-
-    try:
-        # Use tqdm for progress if available
-        if TQDM_AVAILABLE:
-            desc = f"🔄 STREAM: {pdf_path.name}"
-            with tqdm(desc=desc, unit="table", leave=False) as pbar:
-                tables = camelot.read_pdf(str(pdf_path), **stream_kwargs)
-                pbar.total = len(tables)
-                pbar.refresh()
-
-                extractions = []
-                successful_pages = set()
-
-                for idx, table in enumerate(tables):
-                    table_id = f"table_{idx+1:03d}"
-                    page_num = table.page
-
-                    # Get accuracy score
-                    accuracy = table.accuracy if hasattr(table, 'accuracy') else 0.0
-
-                    # Get parsing report
-                    parsing_report = table.parsing_report if hasattr(table, 'parsing_report') else {}
-
-                    # Get bounding box
-                    bbox = table._bbox if hasattr(table, '_bbox') else (0, 0, 0, 0)
-
-                    extraction = CamelotTableExtraction(
-                        table_id=table_id,
-                        page=page_num,
-                        dataframe=table.df,
-                        accuracy=accuracy,
-                        parsing_report=parsing_report,
-                        extraction_mode="stream",
-                        bbox=bbox
-                    )
-
-                    extractions.append(extraction)
-                    successful_pages.add(page_num)
-
-                    pbar.set_postfix({"page": page_num, "acc": f"{accuracy:.2%}"})
-                    pbar.update(1)
-
-                logger.info(f"✅ STREAM: {len(extractions)} tables on {len(successful_pages)} pages")
-                return extractions, successful_pages
-        else:
-            # Fallback without tqdm
-            tables = camelot.read_pdf(str(pdf_path), **stream_kwargs)
-
-            extractions = []
-            successful_pages = set()
-
-            for idx, table in enumerate(tables):
-                table_id = f"table_{idx+1:03d}"
-                page_num = table.page
-
-                accuracy = table.accuracy if hasattr(table, 'accuracy') else 0.0
-                parsing_report = table.parsing_report if hasattr(table, 'parsing_report') else {}
-                bbox = table._bbox if hasattr(table, '_bbox') else (0, 0, 0, 0)
-
-                extraction = CamelotTableExtraction(
-                    table_id=table_id,
-                    page=page_num,
-                    dataframe=table.df,
-                    accuracy=accuracy,
-                    parsing_report=parsing_report,
-                    extraction_mode="stream",
-                    bbox=bbox
-                )
-
-                extractions.append(extraction)
-                successful_pages.add(page_num)
-
-            logger.info(f"✅ STREAM: {len(extractions)} tables on {len(successful_pages)} pages")
-            return extractions, successful_pages
-
-    except Exception as e:
-        logger.error(f"❌ STREAM extraction failed: {str(e)}")
-        return [], set()
+    return _extract_tables(pdf_path, 'stream', pages=pages, **kwargs)
 
 
 def extract_tables_hybrid(
@@ -355,12 +580,45 @@ def extract_tables_hybrid(
     """
     logger.info(f"🚀 HYBRID extraction: {pdf_path.name}")
 
-    # Step 1: Try LATTICE mode first
-    lattice_extractions, lattice_pages = extract_tables_with_lattice(
-        pdf_path,
-        pages=pages,
-        **kwargs.get('lattice_kwargs', {})
-    )
+    cache_path = _hybrid_cache_path(pdf_path, pages, lattice_accuracy_threshold, kwargs)
+    if cache_path is not None:
+        cached = _load_cached_extraction(cache_path)
+        if cached is not None:
+            logger.info(f"♻️ Reusing cached Camelot extraction: {cache_path.name}")
+            return cached
+
+    # Explicit page specs declare the page universe up front, so STREAM can run
+    # speculatively alongside LATTICE and be filtered afterwards instead of
+    # waiting for LATTICE to finish. 'all' keeps the sequential fallback.
+    # Only when extraction runs in-process: with CAMELOT_MAX_WORKERS > 1 each
+    # flavor already fans pages out over its own process pool, so running both
+    # at once would double the worker processes (and STREAM every page) while the
+    # CPUs are already busy.
+    speculative_stream = pages != 'all' and CAMELOT_MAX_WORKERS <= 1
+
+    # Step 1: Try LATTICE mode first (with STREAM on the same pages when speculative)
+    if speculative_stream:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lattice_future = executor.submit(
+                extract_tables_with_lattice,
+                pdf_path,
+                pages=pages,
+                **kwargs.get('lattice_kwargs', {})
+            )
+            stream_future = executor.submit(
+                extract_tables_with_stream,
+                pdf_path,
+                pages=pages,
+                **kwargs.get('stream_kwargs', {})
+            )
+            lattice_extractions, lattice_pages = lattice_future.result()
+            speculative_stream_extractions, _ = stream_future.result()
+    else:
+        lattice_extractions, lattice_pages = extract_tables_with_lattice(
+            pdf_path,
+            pages=pages,
+            **kwargs.get('lattice_kwargs', {})
+        )
 
     # Filter low-accuracy LATTICE results
     high_accuracy_lattice = []
@@ -383,17 +641,22 @@ def extract_tables_hybrid(
         missing_pages = requested_pages - lattice_pages
         stream_pages = missing_pages.union(low_accuracy_pages)
 
-    # Step 3: Run STREAM mode on missing/low-accuracy pages
+    # Step 3: Keep STREAM results only for missing/low-accuracy pages
     stream_extractions = []
     if stream_pages:
-        stream_pages_str = ','.join(map(str, sorted(stream_pages)))
+        stream_pages_str = format_page_spec(stream_pages)
         logger.info(f"🔄 STREAM fallback: pages {stream_pages_str}")
 
-        stream_extractions, stream_successful = extract_tables_with_stream(
-            pdf_path,
-            pages=stream_pages_str,
-            **kwargs.get('stream_kwargs', {})
-        )
+        if speculative_stream:
+            stream_extractions = [
+                e for e in speculative_stream_extractions if e.page in stream_pages
+            ]
+        else:
+            stream_extractions, stream_successful = extract_tables_with_stream(
+                pdf_path,
+                pages=stream_pages_str,
+                **kwargs.get('stream_kwargs', {})
+            )
 
     # Step 4: Validate text order and apply pdfplumber fallback if needed
     validated_extractions = []
@@ -401,24 +664,32 @@ def extract_tables_hybrid(
 
     all_extractions_temp = high_accuracy_lattice + stream_extractions
 
-    for extraction in all_extractions_temp:
-        # Validate text order
-        if not validate_table_text_order(extraction.dataframe):
+    # Validate text order
+    valid_flags = [validate_table_text_order(e.dataframe) for e in all_extractions_temp]
+
+    failed_indices = []
+    for idx, (extraction, is_valid) in enumerate(zip(all_extractions_temp, valid_flags)):
+        if not is_valid:
             logger.warning(f"⚠️ {extraction.table_id} (Page {extraction.page}) has text order issues")
+            failed_indices.append(idx)
 
-            # Try pdfplumber fallback
-            fixed_extraction = fix_table_with_pdfplumber(pdf_path, extraction)
+    # Try pdfplumber fallback for all failing tables in one pass over the PDF
+    fixed_by_index = dict(zip(
+        failed_indices,
+        fix_tables_with_pdfplumber(pdf_path, [all_extractions_temp[idx] for idx in failed_indices])
+    ))
 
-            if fixed_extraction:
-                validated_extractions.append(fixed_extraction)
-                pdfplumber_fallback_count += 1
-            else:
-                # Keep original even if validation failed
-                logger.warning(f"  ⚠️ Keeping original (pdfplumber fallback unavailable)")
-                validated_extractions.append(extraction)
-        else:
+    for idx, extraction in enumerate(all_extractions_temp):
+        if idx not in fixed_by_index:
             # Text order is OK
             validated_extractions.append(extraction)
+        elif fixed_by_index[idx]:
+            validated_extractions.append(fixed_by_index[idx])
+            pdfplumber_fallback_count += 1
+        else:
+            # Keep original even if validation failed
+            logger.warning(f"  ⚠️ Keeping original (pdfplumber fallback unavailable)")
+            validated_extractions.append(extraction)
 
     all_extractions = validated_extractions
 
@@ -449,6 +720,14 @@ def extract_tables_hybrid(
         logger.info(f"✅ Extracted {summary['total_tables']} tables "
                     f"({summary['lattice_tables']} LATTICE + {summary['stream_tables']} STREAM)")
 
+    # Compact integer columns once, before results are cached or serialized
+    for extraction in all_extractions:
+        extraction.optimize_dtypes()
+
+    # Empty results are not cached: LATTICE/STREAM swallow Camelot errors and return []
+    if cache_path is not None and all_extractions:
+        _store_cached_extraction(cache_path, (all_extractions, summary))
+
     return all_extractions, summary
 
 
@@ -474,33 +753,29 @@ def validate_table_text_order(df: pd.DataFrame) -> bool:
         - "10.13(월)" - correct format
         - "2.4(화)~2.7(금)" - correct range format
     """
-    import re
+    # Extract all cell texts (including cells with newlines), column by column,
+    # flattened and NA-filtered in NumPy rather than per cell in Python
+    values = df.to_numpy().ravel(order='F')
+    values = values[pd.notna(values)]
+    if values.size == 0:
+        return True
 
-    # Extract all cell texts (including cells with newlines)
-    all_texts = []
-    for col in df.columns:
-        for val in df[col]:
-            if pd.notna(val):
-                all_texts.append(str(val))
+    combined_text = ' '.join(values.astype(str).tolist())
 
-    # Combine all cell texts and normalize whitespace
+    # Every corrupted pattern ends in a weekday character; tables without one
+    # (most of them) skip normalization and the alternation scan entirely
+    if _WEEKDAY_RE.search(combined_text) is None:
+        return True
+
+    # Normalize whitespace
     # Convert all whitespace (spaces, newlines, tabs) to single space
-    combined_text = ' '.join(all_texts)
-    combined_text = re.sub(r'\s+', ' ', combined_text)
-
-    # Corrupted patterns to detect (improved: removed strict suffix requirements)
-    corrupted_patterns = [
-        r'\)\s*[월화수목금토일]\s+\d+',           # ") 수 10" (removed trailing '.')
-        r'\d+\s*일\s*[월화수목금토일]',            # "14일화" (removed trailing '\(')
-        r'\d+\.\d+\s*\(\s*\)\s*[월화수목금토일]',  # "2.4( ) 화"
-        r'\(\s*\)\s*[월화수목금토일]',             # "( ) 화"
-    ]
+    combined_text = _WS_RE.sub(' ', combined_text)
 
-    # Check if text contains corrupted patterns
-    for pattern in corrupted_patterns:
-        if re.search(pattern, combined_text):
-            logger.debug(f"   Detected corrupted pattern: {pattern} in text: {combined_text[:100]}...")
-            return False
+    # Check if text contains corrupted patterns (improved: removed strict suffix requirements)
+    match = _CORRUPTED_RE.search(combined_text)
+    if match:
+        logger.debug(f"   Detected corrupted pattern: {match.group()!r} in text: {combined_text[:100]}...")
+        return False
 
     # If no corrupted patterns found, text order is OK
     return True
@@ -548,6 +823,51 @@ def fix_table_with_pdfplumber(
         return None
 
 
+def fix_tables_with_pdfplumber(
+    pdf_path: Path,
+    extractions: List[CamelotTableExtraction]
+) -> List[Optional[CamelotTableExtraction]]:
+    """
+    Batched fix_table_with_pdfplumber: re-extract several tables in one pdfplumber pass.
+
+    The PDF is opened once and each page loaded once, instead of one
+    open/parse cycle per failing table.
+
+    Args:
+        pdf_path: Path to PDF file
+        extractions: Camelot extractions with incorrect text order
+
+    Returns:
+        Updated extraction or None (if failed) for each input, in order
+    """
+    if not extractions:
+        return []
+
+    if not PDFPLUMBER_AVAILABLE:
+        logger.warning("pdfplumber not available for fallback")
+        return [None] * len(extractions)
+
+    fixed_dfs = extract_tables_from_regions(
+        pdf_path,
+        [(extraction.page, extraction.bbox) for extraction in extractions]
+    )
+
+    results = []
+    for extraction, fixed_df in zip(extractions, fixed_dfs):
+        if fixed_df is not None and not fixed_df.empty:
+            # Create updated extraction with fixed DataFrame
+            extraction.dataframe = fixed_df
+            extraction.extraction_mode = "pdfplumber_fallback"
+            extraction.parsing_report["fallback_reason"] = "text_order_validation_failed"
+
+            logger.info(f"  ✅ Fixed {extraction.table_id} with pdfplumber")
+            results.append(extraction)
+        else:
+            results.append(None)
+
+    return results
+
+
 def parse_page_spec(page_spec: str) -> Set[int]:
     """
     Parse page specification string into set of page numbers.
@@ -562,22 +882,79 @@ def parse_page_spec(page_spec: str) -> Set[int]:
 
     Returns:
         Set of page numbers
+
+    Raises:
+        ValueError: If a part is not a page number or numeric range (e.g. "1-end")
     """
     pages = set()
 
     for part in page_spec.split(','):
-        part = part.strip()
-        if '-' in part:
-            # Range: "1-5"
-            start, end = part.split('-')
-            pages.update(range(int(start), int(end) + 1))
-        else:
+        match = _PAGE_SPEC_PART_RE.fullmatch(part)
+        if match is None:
+            raise ValueError(f"Invalid page specification: {part!r}")
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else start
+        if start == end:
             # Single page: "3"
-            pages.add(int(part))
+            pages.add(start)
+        else:
+            # Range: "1-5"
+            pages.update(range(start, end + 1))
 
     return pages
 
 
+def format_page_spec(pages: Set[int]) -> str:
+    """
+    Format page numbers as a compact Camelot page specification.
+
+    Examples:
+        {1, 2, 3, 4, 5, 7} -> "1-5,7"
+        {2, 4} -> "2,4"
+    """
+    parts = []
+    run_start = run_end = None
+
+    for page in sorted(pages):
+        if run_end is not None and page == run_end + 1:
+            run_end = page
+            continue
+        if run_start is not None:
+            parts.append(str(run_start) if run_start == run_end else f"{run_start}-{run_end}")
+        run_start = run_end = page
+
+    if run_start is not None:
+        parts.append(str(run_start) if run_start == run_end else f"{run_start}-{run_end}")
+
+    return ','.join(parts)
+
+
+def _extraction_json_bytes(extraction: CamelotTableExtraction) -> bytes:
+    """
+    Serialize one extraction for save_camelot_extractions.
+
+    With orjson.Fragment, row data comes straight from DataFrame.to_json (C
+    encoder) and is embedded as-is instead of building one dict per row.
+    """
+    if _ORJSON_FRAGMENT is not None:
+        try:
+            rows = extraction.dataframe.to_json(orient='records', force_ascii=False)
+        except ValueError:
+            # Duplicate column labels (e.g. pdfplumber header rows) are not valid for to_json
+            rows = None
+
+        if rows is not None:
+            data = extraction._metadata_dict()
+            data["data"] = _ORJSON_FRAGMENT(rows)
+            data["parsing_report"] = extraction.parsing_report
+            return orjson.dumps(data, option=_ORJSON_SAVE_OPTIONS)
+
+    data = extraction.to_dict()
+    if orjson:
+        return orjson.dumps(data, option=_ORJSON_SAVE_OPTIONS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
 def save_camelot_extractions(
     extractions: List[CamelotTableExtraction],
     output_dir: Path,
@@ -603,10 +980,8 @@ def save_camelot_extractions(
         base_filename = f"{extraction.table_id}_page{extraction.page}"
 
         if format == 'json':
-            import json
             filepath = output_dir / f"{base_filename}.json"
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(extraction.to_dict(), f, ensure_ascii=False, indent=2)
+            filepath.write_bytes(_extraction_json_bytes(extraction))
 
         elif format == 'csv':
             filepath = output_dir / f"{base_filename}.csv"
@@ -1,33 +1,124 @@
 """
 CRUD (Create, Read, Update, Delete) operations for database models.
+
+Write helpers only flush; they never commit. The transaction boundary is the
+caller's: request handlers get a commit from the get_db dependency, and
+background parsing jobs commit through app.utils.parsing_db.
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, make_transient_to_detached, selectinload
+from sqlalchemy import Row, and_, bindparam, event, exists, func, insert, or_, select, update
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+import threading
+import time
 
 from app import db_models, schemas
 
+# Bulk insert statements built once so their compiled SQL is reused from the cache
+_INSERT_TABLES_RETURNING = insert(db_models.Table).returning(db_models.Table, sort_by_parameter_order=True)
+_INSERT_PICTURES_RETURNING = insert(db_models.Picture).returning(db_models.Picture, sort_by_parameter_order=True)
+
+def _column_values(model, obj) -> dict:
+    """
+    Column values of a flat Create schema for constructing ``model``.
+
+    Reads the validated field values straight from the instance instead of
+    running a model_dump() serialization pass, and drops schema fields the
+    model has no column for (e.g. PictureCreate.chunk_id).
+    """
+    columns = model.__table__.columns
+    return {key: value for key, value in obj.__dict__.items() if key in columns}
+
+
+# Bulk helpers dump a whole batch of schemas in one pydantic-core pass
+_TABLE_CREATE_LIST = TypeAdapter(List[schemas.TableCreate])
+_PICTURE_CREATE_LIST = TypeAdapter(List[schemas.PictureCreate])
+
+# Hot read statements, also built once with bound parameters: each call only
+# binds values instead of rebuilding the ORM Query and its cache key
+_SELECT_DOCUMENT_EXISTS = select(exists().where(db_models.Document.id == bindparam("document_id")))
+_SELECT_DOCUMENT_FULL = select(db_models.Document).where(
+    db_models.Document.id == bindparam("document_id")
+).options(selectinload(db_models.Document.tables), selectinload(db_models.Document.pictures))
+_SELECT_DOCUMENT_BY_FILENAME = select(db_models.Document).where(
+    db_models.Document.filename == bindparam("filename")
+).limit(1)
+_SELECT_TABLES_BY_DOCUMENT = select(db_models.Table).where(
+    db_models.Table.document_id == bindparam("document_id")
+).order_by(db_models.Table.table_index)
+_SELECT_TABLE_BY_TABLE_ID = select(db_models.Table).where(
+    db_models.Table.document_id == bindparam("document_id"),
+    db_models.Table.table_id == bindparam("table_id")
+).limit(1)
+_SELECT_PARSING_HISTORY = select(db_models.ParsingHistory).where(
+    db_models.ParsingHistory.document_id == bindparam("document_id")
+).order_by(
+    db_models.ParsingHistory.created_at.desc(), db_models.ParsingHistory.id.desc()
+).limit(bindparam("limit"))
+_SELECT_PICTURES_BY_DOCUMENT = select(db_models.Picture).where(
+    db_models.Picture.document_id == bindparam("document_id")
+)
+_SELECT_LATEST_DIFY_CONFIG = select(db_models.DifyConfig).order_by(
+    db_models.DifyConfig.updated_at.desc()
+).limit(1)
+_SELECT_UPLOAD_LOG_IDS_BY_BATCH = select(db_models.DifyUploadLog.id).where(
+    db_models.DifyUploadLog.batch_id == bindparam("batch_id")
+)
+_SELECT_UPLOAD_HISTORY = select(db_models.DifyUploadLog).order_by(
+    db_models.DifyUploadLog.uploaded_at.desc(), db_models.DifyUploadLog.id.desc()
+).limit(bindparam("limit"))
+
 
 # ===== Document CRUD =====
 
 def create_document(db: Session, document: schemas.DocumentCreate) -> db_models.Document:
     """Create a new document record."""
-    db_document = db_models.Document(**document.model_dump())
+    db_document = db_models.Document(**_column_values(db_models.Document, document))
     db.add(db_document)
-    db.commit()
-    db.refresh(db_document)
+    db.flush()
     return db_document
 
 
 def get_document_by_id(db: Session, document_id: int) -> Optional[db_models.Document]:
-    """Get a document by its ID."""
-    return db.query(db_models.Document).filter(db_models.Document.id == document_id).first()
+    """Get a document by its ID (identity map first, so already-loaded documents cost no SQL)."""
+    return db.get(db_models.Document, document_id)
+
+
+def document_exists(db: Session, document_id: int) -> bool:
+    """Check whether a document exists (SELECT EXISTS; no row is loaded into the session)."""
+    return db.scalar(_SELECT_DOCUMENT_EXISTS, {"document_id": document_id})
+
+
+def get_document_full(db: Session, document_id: int) -> Optional[db_models.Document]:
+    """
+    Get a document with its tables and pictures already loaded.
+
+    Each collection comes from one extra SELECT ... WHERE document_id IN (...),
+    so reading document.tables / document.pictures afterwards issues no SQL.
+    """
+    return db.scalars(_SELECT_DOCUMENT_FULL, {"document_id": document_id}).one_or_none()
 
 
 def get_document_by_filename(db: Session, filename: str) -> Optional[db_models.Document]:
     """Get a document by its filename."""
-    return db.query(db_models.Document).filter(db_models.Document.filename == filename).first()
+    return db.scalars(_SELECT_DOCUMENT_BY_FILENAME, {"filename": filename}).first()
+
+
+def get_document_lookup_by_filenames(db: Session, filenames: List[str]) -> Dict[str, Row]:
+    """
+    Get filename, content_md_path and parsing_strategy for several filenames, keyed by filename.
+
+    Single IN query selecting only those columns; no ORM Document objects are built.
+    """
+    if not filenames:
+        return {}
+    rows = db.query(
+        db_models.Document.filename,
+        db_models.Document.content_md_path,
+        db_models.Document.parsing_strategy
+    ).filter(db_models.Document.filename.in_(filenames)).all()
+    return {row.filename: row for row in rows}
 
 
 def list_documents(
@@ -57,8 +148,7 @@ def update_document(
     for field, value in update_data.items():
         setattr(db_document, field, value)
 
-    db_document.updated_at = datetime.utcnow()
-    db.commit()
+    db.flush()
     db.refresh(db_document)
     return db_document
 
@@ -70,24 +160,43 @@ def delete_document(db: Session, document_id: int) -> bool:
         return False
 
     db.delete(db_document)
-    db.commit()
+    db.flush()
     return True
 
 
+def _document_count_columns():
+    """
+    Correlated scalar COUNT subqueries (tables, pictures) for a Document query.
+
+    Each is one index lookup on its document_id for every returned document,
+    so child rows are never joined (and multiplied) against each other.
+    """
+    table_count = select(func.count(db_models.Table.id)).where(
+        db_models.Table.document_id == db_models.Document.id
+    ).correlate(db_models.Document).scalar_subquery()
+
+    picture_count = select(func.count(db_models.Picture.id)).where(
+        db_models.Picture.document_id == db_models.Document.id
+    ).correlate(db_models.Document).scalar_subquery()
+
+    return table_count, picture_count
+
+
 def get_document_with_counts(db: Session, document_id: int) -> Optional[dict]:
-    """Get document with aggregated counts of tables and pictures."""
-    document = get_document_by_id(db, document_id)
-    if not document:
-        return None
+    """
+    Get document with aggregated counts of tables and pictures.
 
-    table_count = db.query(func.count(db_models.Table.id)).filter(
-        db_models.Table.document_id == document_id
-    ).scalar()
+    One SELECT with the counts as correlated scalar subqueries.
+    """
+    result = db.query(
+        db_models.Document,
+        *_document_count_columns()
+    ).filter(db_models.Document.id == document_id).first()
 
-    picture_count = db.query(func.count(db_models.Picture.id)).filter(
-        db_models.Picture.document_id == document_id
-    ).scalar()
+    if not result:
+        return None
 
+    document, table_count, picture_count = result
     return {
         "document": document,
         "chunk_count": 0,  # Chunk is not used
@@ -96,36 +205,88 @@ def get_document_with_counts(db: Session, document_id: int) -> Optional[dict]:
     }
 
 
+# Listing sort keys: order_by value -> (column, descending). Ties (and the
+# order_by=None listing) are broken on Document.id in the same direction.
+_DOCUMENT_SORT_KEYS = {
+    "last_parsed_at": (db_models.Document.last_parsed_at, True),
+    "created_at": (db_models.Document.created_at, True),
+    "filename": (db_models.Document.filename, False),
+}
+
+
+def _document_keyset_filter(order_by: Optional[str], cursor: Tuple[Any, int]):
+    """
+    WHERE clause selecting the rows after ``cursor`` (sort value, id) in listing order.
+
+    NULL sort values come last in both directions, matching the ORDER BY.
+    """
+    value, last_id = cursor
+    if order_by not in _DOCUMENT_SORT_KEYS:
+        return db_models.Document.id > last_id
+
+    column, descending = _DOCUMENT_SORT_KEYS[order_by]
+    if value is None:
+        # Already inside the NULL tail: only the id tiebreak remains
+        id_after = db_models.Document.id < last_id if descending else db_models.Document.id > last_id
+        return and_(column.is_(None), id_after)
+
+    if descending:
+        return or_(
+            column < value,
+            and_(column == value, db_models.Document.id < last_id),
+            column.is_(None),
+        )
+    return or_(
+        column > value,
+        and_(column == value, db_models.Document.id > last_id),
+        column.is_(None),
+    )
+
+
 def list_documents_with_counts(
     db: Session,
-    skip: int = 0,
+    cursor: Optional[Tuple[Any, int]] = None,
     limit: int = 100,
     status: Optional[str] = None,
-    order_by: str = "last_parsed_at"
-) -> List[dict]:
-    """List all documents with aggregated counts of tables and pictures."""
+    order_by: Optional[str] = "last_parsed_at"
+) -> Tuple[List[dict], Optional[Tuple[Any, int]]]:
+    """
+    List documents with aggregated counts of tables and pictures, one keyset page at a time.
+
+    Counts are correlated scalar subqueries (one index lookup per document
+    and child table), so tables x pictures rows are never multiplied out by
+    a double join and no whole-table GROUP BY is materialized.
+
+    Pages are keyset-paginated: pass the returned ``next_cursor`` (sort value
+    and id of the page's last document) as ``cursor`` to get the next page.
+    Unlike OFFSET, later pages don't scan and discard the earlier rows.
+
+    Returns:
+        (documents, next_cursor); next_cursor is None on the last page
+    """
     query = db.query(
         db_models.Document,
-        func.count(db_models.Table.id.distinct()).label('table_count'),
-        func.count(db_models.Picture.id.distinct()).label('picture_count')
-    ).outerjoin(
-        db_models.Table, db_models.Document.id == db_models.Table.document_id
-    ).outerjoin(
-        db_models.Picture, db_models.Document.id == db_models.Picture.document_id
-    ).group_by(db_models.Document.id)
+        *_document_count_columns()
+    )
 
     if status:
         query = query.filter(db_models.Document.parsing_status == status)
 
-    # Order by specified field (default: last_parsed_at descending)
-    if order_by == "last_parsed_at":
-        query = query.order_by(db_models.Document.last_parsed_at.desc().nullslast())
-    elif order_by == "created_at":
-        query = query.order_by(db_models.Document.created_at.desc())
-    elif order_by == "filename":
-        query = query.order_by(db_models.Document.filename.asc())
+    if cursor is not None:
+        query = query.filter(_document_keyset_filter(order_by, cursor))
 
-    results = query.offset(skip).limit(limit).all()
+    # Order by specified field (default: last_parsed_at descending; None keeps primary key order)
+    sort_key = _DOCUMENT_SORT_KEYS.get(order_by)
+    if sort_key is None:
+        query = query.order_by(db_models.Document.id.asc())
+    else:
+        column, descending = sort_key
+        if descending:
+            query = query.order_by(column.desc().nullslast(), db_models.Document.id.desc())
+        else:
+            query = query.order_by(column.asc().nullslast(), db_models.Document.id.asc())
+
+    results = query.limit(limit).all()
 
     # Convert to list of dicts
     documents_with_counts = []
@@ -137,42 +298,50 @@ def list_documents_with_counts(
             "picture_count": picture_count or 0,
         })
 
-    return documents_with_counts
+    next_cursor = None
+    if results and len(results) == limit:
+        last = results[-1][0]
+        next_cursor = (getattr(last, sort_key[0].key) if sort_key else None, last.id)
+
+    return documents_with_counts, next_cursor
 
 
 # ===== Table CRUD =====
 
 def create_table(db: Session, table: schemas.TableCreate) -> db_models.Table:
     """Create a new table record."""
-    db_table = db_models.Table(**table.model_dump())
+    db_table = db_models.Table(**_column_values(db_models.Table, table))
     db.add(db_table)
-    db.commit()
-    db.refresh(db_table)
+    db.flush()
     return db_table
 
 
 def create_tables_bulk(db: Session, tables: List[schemas.TableCreate]) -> List[db_models.Table]:
-    """Create multiple tables in bulk."""
-    db_tables = [db_models.Table(**table.model_dump()) for table in tables]
-    db.add_all(db_tables)
-    db.commit()
-    for table in db_tables:
-        db.refresh(table)
-    return db_tables
+    """
+    Create multiple tables in bulk.
+
+    Uses a single executemany INSERT ... RETURNING instead of per-row
+    ORM adds followed by a refresh SELECT for every row.
+    """
+    if not tables:
+        return []
+
+    db_tables = db.scalars(
+        _INSERT_TABLES_RETURNING,
+        _TABLE_CREATE_LIST.dump_python(tables)
+    ).all()
+    return list(db_tables)
 
 
 def get_tables_by_document_id(db: Session, document_id: int) -> List[db_models.Table]:
     """Get all tables for a document."""
-    return db.query(db_models.Table).filter(
-        db_models.Table.document_id == document_id
-    ).order_by(db_models.Table.table_index).all()
+    return list(db.scalars(_SELECT_TABLES_BY_DOCUMENT, {"document_id": document_id}))
 
 
 def get_table_by_table_id(db: Session, document_id: int, table_id: str) -> Optional[db_models.Table]:
     """Get a specific table by its table_id."""
-    return db.query(db_models.Table).filter(
-        db_models.Table.document_id == document_id,
-        db_models.Table.table_id == table_id
+    return db.scalars(
+        _SELECT_TABLE_BY_TABLE_ID, {"document_id": document_id, "table_id": table_id}
     ).first()
 
 
@@ -182,12 +351,12 @@ def update_table_summary(
     summary: str
 ) -> Optional[db_models.Table]:
     """Update a table's AI-generated summary (Phase 8)."""
-    db_table = db.query(db_models.Table).filter(db_models.Table.id == table_id).first()
+    db_table = db.get(db_models.Table, table_id)
     if not db_table:
         return None
 
     db_table.summary = summary
-    db.commit()
+    db.flush()
     db.refresh(db_table)
     return db_table
 
@@ -199,10 +368,9 @@ def create_parsing_history(
     history: schemas.ParsingHistoryCreate
 ) -> db_models.ParsingHistory:
     """Create a new parsing history record."""
-    db_history = db_models.ParsingHistory(**history.model_dump())
+    db_history = db_models.ParsingHistory(**_column_values(db_models.ParsingHistory, history))
     db.add(db_history)
-    db.commit()
-    db.refresh(db_history)
+    db.flush()
     return db_history
 
 
@@ -212,46 +380,80 @@ def get_parsing_history(
     limit: int = 10
 ) -> List[db_models.ParsingHistory]:
     """Get parsing history for a document."""
-    return db.query(db_models.ParsingHistory).filter(
-        db_models.ParsingHistory.document_id == document_id
-    ).order_by(db_models.ParsingHistory.created_at.desc()).limit(limit).all()
+    return list(db.scalars(_SELECT_PARSING_HISTORY, {"document_id": document_id, "limit": limit}))
 
 
 # ===== Picture CRUD =====
 
 def create_picture(db: Session, picture: schemas.PictureCreate) -> db_models.Picture:
     """Create a new picture record."""
-    db_picture = db_models.Picture(**picture.model_dump())
+    db_picture = db_models.Picture(**_column_values(db_models.Picture, picture))
     db.add(db_picture)
-    db.commit()
-    db.refresh(db_picture)
+    db.flush()
     return db_picture
 
 
 def create_pictures_bulk(db: Session, pictures: List[schemas.PictureCreate]) -> List[db_models.Picture]:
-    """Create multiple pictures in bulk."""
-    db_pictures = [db_models.Picture(**picture.model_dump()) for picture in pictures]
-    db.add_all(db_pictures)
-    db.commit()
-    for picture in db_pictures:
-        db.refresh(picture)
-    return db_pictures
+    """
+    Create multiple pictures in bulk.
+
+    Same single executemany INSERT ... RETURNING as create_tables_bulk.
+    """
+    if not pictures:
+        return []
+
+    db_pictures = db.scalars(
+        _INSERT_PICTURES_RETURNING,
+        _PICTURE_CREATE_LIST.dump_python(pictures)
+    ).all()
+    return list(db_pictures)
 
 
 def get_pictures_by_document_id(db: Session, document_id: int) -> List[db_models.Picture]:
     """Get all pictures for a document."""
-    return db.query(db_models.Picture).filter(
-        db_models.Picture.document_id == document_id
-    ).all()
+    return list(db.scalars(_SELECT_PICTURES_BY_DOCUMENT, {"document_id": document_id}))
 
 
 # ===== Dify CRUD =====
 
+# The Dify config is a single, rarely written row read on every Dify request.
+# A detached snapshot is kept per process and merged into the caller's session
+# without SQL; committed writes bump the version and drop it, and the TTL bounds
+# staleness from writes made by other processes.
+DIFY_CONFIG_CACHE_TTL_SECONDS = 30.0
+_dify_config_cache: Optional[Tuple[db_models.DifyConfig, float]] = None
+_dify_config_version = 0
+_dify_config_lock = threading.Lock()
+
+
+def _invalidate_dify_config_cache(session: Optional[Session] = None) -> None:
+    global _dify_config_cache, _dify_config_version
+    with _dify_config_lock:
+        _dify_config_cache = None
+        _dify_config_version += 1
+
+
 def get_dify_config(db: Session) -> Optional[db_models.DifyConfig]:
-    """Get the most recent Dify configuration."""
-    return db.query(db_models.DifyConfig).order_by(
-        db_models.DifyConfig.updated_at.desc()
-    ).first()
+    """Get the most recent Dify configuration (served from the in-process cache when fresh)."""
+    global _dify_config_cache
+    with _dify_config_lock:
+        cached = _dify_config_cache
+        version = _dify_config_version
+    if cached is not None and time.monotonic() - cached[1] < DIFY_CONFIG_CACHE_TTL_SECONDS:
+        return db.merge(cached[0], load=False)
+
+    config = db.scalars(_SELECT_LATEST_DIFY_CONFIG).first()
+    if config is not None:
+        snapshot = db_models.DifyConfig(**{
+            column.key: getattr(config, column.key)
+            for column in db_models.DifyConfig.__table__.columns
+        })
+        make_transient_to_detached(snapshot)
+        with _dify_config_lock:
+            # Skip the store if a write invalidated the cache while we were reading
+            if version == _dify_config_version:
+                _dify_config_cache = (snapshot, time.monotonic())
+    return config
 
 
 def create_or_update_dify_config(
@@ -259,14 +461,18 @@ def create_or_update_dify_config(
     api_key: str,
     base_url: str
 ) -> db_models.DifyConfig:
-    """Create or update Dify configuration."""
-    config = get_dify_config(db)
+    """
+    Create or update Dify configuration.
+
+    The config cache is dropped once the caller commits: invalidating before the
+    commit would let a concurrent get_dify_config cache the old committed row.
+    """
+    config = db.scalars(_SELECT_LATEST_DIFY_CONFIG).first()
 
     if config:
         # Update existing config
         config.api_key = api_key
         config.base_url = base_url
-        config.updated_at = datetime.utcnow()
     else:
         # Create new config
         config = db_models.DifyConfig(
@@ -275,8 +481,9 @@ def create_or_update_dify_config(
         )
         db.add(config)
 
-    db.commit()
+    db.flush()
     db.refresh(config)
+    event.listen(db, "after_commit", _invalidate_dify_config_cache, once=True)
     return config
 
 
@@ -300,8 +507,7 @@ def create_upload_log(
         indexing_status="waiting"
     )
     db.add(log)
-    db.commit()
-    db.refresh(log)
+    db.flush()
     return log
 
 
@@ -312,9 +518,7 @@ def update_upload_log(
     completed_at: Optional[datetime] = None
 ) -> Optional[db_models.DifyUploadLog]:
     """Update an upload log."""
-    log = db.query(db_models.DifyUploadLog).filter(
-        db_models.DifyUploadLog.id == log_id
-    ).first()
+    log = db.get(db_models.DifyUploadLog, log_id)
 
     if not log:
         return None
@@ -323,13 +527,31 @@ def update_upload_log(
     if completed_at:
         log.completed_at = completed_at
 
-    db.commit()
+    db.flush()
     db.refresh(log)
     return log
 
 
+def get_upload_log_ids_by_batch(db: Session, batch_id: str) -> List[int]:
+    """Get the IDs of the upload logs for a Dify batch (no ORM objects are loaded)."""
+    return list(db.scalars(_SELECT_UPLOAD_LOG_IDS_BY_BATCH, {"batch_id": batch_id}))
+
+
+def update_upload_logs_bulk(db: Session, updates: List[dict]) -> int:
+    """
+    Update several upload logs at once.
+
+    Each dict holds the log's ``id`` plus the columns to set (``indexing_status``,
+    optionally ``completed_at``). Runs as an ORM bulk UPDATE by primary key: one
+    executemany per set of keys, with no SELECT or refresh per row.
+    """
+    if not updates:
+        return 0
+
+    db.execute(update(db_models.DifyUploadLog), updates)
+    return len(updates)
+
+
 def get_upload_history(db: Session, limit: int = 50) -> List[db_models.DifyUploadLog]:
     """Get upload history (most recent first)."""
-    return db.query(db_models.DifyUploadLog).order_by(
-        db_models.DifyUploadLog.uploaded_at.desc()
-    ).limit(limit).all()
+    return list(db.scalars(_SELECT_UPLOAD_HISTORY, {"limit": limit}))
@@ -1,7 +1,7 @@
 # Custom Serializers for Markdown + HTML混合 출력
 # 표만 HTML로, 나머지는 Markdown으로 출력
 
-from typing import Any
+from typing import Any, Dict, Tuple
 from docling_core.transforms.serializer.base import BaseTableSerializer, SerializationResult
 from docling_core.transforms.serializer.common import create_ser_result
 from docling_core.types.doc.document import TableItem, DoclingDocument
@@ -14,8 +14,16 @@ class HTMLTableSerializer(BaseTableSerializer):
 
     This is useful for RAG systems that need structured table data
     preserved in HTML while keeping the rest of the document in Markdown.
+
+    Create one instance per document: the HTML of each table is built once and
+    reused when the same TableItem is serialized again in that pass.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        # id(item) -> (item, html); the item is kept so its id can't be reused
+        self._html_cache: Dict[int, Tuple[TableItem, str]] = {}
+
     def serialize(
         self,
         *,
@@ -34,8 +42,13 @@ class HTMLTableSerializer(BaseTableSerializer):
         Returns:
             SerializationResult with HTML table content
         """
-        # Use TableItem's built-in export_to_html method
-        html_content = item.export_to_html(doc=doc, add_caption=True)
+        cached = self._html_cache.get(id(item))
+        if cached is not None and cached[0] is item:
+            html_content = cached[1]
+        else:
+            # Use TableItem's built-in export_to_html method
+            html_content = item.export_to_html(doc=doc, add_caption=True)
+            self._html_cache[id(item)] = (item, html_content)
 
         # Create serialization result
         return create_ser_result(text=html_content, span_source=item)
@@ -1,7 +1,6 @@
 """
 SQLAlchemy ORM models for the parsing application.
 """
-from datetime import datetime
 from sqlalchemy import (
     Column,
     Integer,
@@ -13,17 +12,29 @@ from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
     Index,
+    func,
+    text,
 )
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
+# Timestamps are stamped by SQLite (CURRENT_TIMESTAMP, UTC) inside the INSERT/UPDATE
+# itself. default=func.now() renders it inline in the ORM's statements, so databases
+# created before server_default existed (create_all never alters tables) still get a
+# value; server_default puts the same DEFAULT into newly created tables.
+
+
 class Document(Base):
     """
     Document metadata table.
     Stores information about parsed documents.
     """
     __tablename__ = "documents"
+    __table_args__ = (
+        # Serves the completed-documents listing: filter parsing_status, keyset on last_parsed_at DESC
+        Index("idx_documents_status_last_parsed", "parsing_status", "last_parsed_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     filename = Column(String, nullable=False, unique=True, index=True)
@@ -33,17 +44,24 @@ class Document(Base):
     total_pages = Column(Integer)
     parsing_status = Column(String, default="pending", index=True)  # pending, processing, completed, failed
     parsing_strategy = Column(String)  # docling, camelot, hybrid
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
     last_parsed_at = Column(DateTime)
     output_folder = Column(String)  # output/{doc_name}/
     content_md_path = Column(String)  # output/{doc_name}/content.md
     manifest_json_path = Column(String)  # output/{doc_name}/manifest.json
 
     # Relationships
-    tables = relationship("Table", back_populates="document", cascade="all, delete-orphan")
-    parsing_history = relationship("ParsingHistory", back_populates="document", cascade="all, delete-orphan")
-    pictures = relationship("Picture", back_populates="document", cascade="all, delete-orphan")
+    # lazy="raise": touching a collection that the query did not load raises instead
+    # of silently issuing one SELECT per document; load with selectinload() at the query
+    tables = relationship(
+        "Table", back_populates="document", cascade="all, delete-orphan",
+        order_by="Table.table_index", lazy="raise"
+    )
+    parsing_history = relationship(
+        "ParsingHistory", back_populates="document", cascade="all, delete-orphan", lazy="raise"
+    )
+    pictures = relationship("Picture", back_populates="document", cascade="all, delete-orphan", lazy="raise")
 
     def __repr__(self):
         return f"<Document(id={self.id}, filename='{self.filename}', status='{self.parsing_status}')>"
@@ -57,7 +75,8 @@ class Table(Base):
     __tablename__ = "tables"
     __table_args__ = (
         UniqueConstraint("document_id", "table_id", name="uq_document_table"),
-        Index("idx_tables_document_id", "document_id"),
+        # Serves get_tables_by_document_id: filter document_id, ORDER BY table_index
+        Index("idx_tables_document_id_table_index", "document_id", "table_index"),
         Index("idx_tables_table_id", "table_id"),
     )
 
@@ -75,7 +94,7 @@ class Table(Base):
     summary = Column(Text)  # AI-generated summary (Phase 8)
     json_path = Column(String)  # tables/table_001.json
     parsing_method = Column(String)  # docling, camelot_lattice, camelot_stream
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     # Relationships
     document = relationship("Document", back_populates="tables")
@@ -91,8 +110,14 @@ class ParsingHistory(Base):
     """
     __tablename__ = "parsing_history"
     __table_args__ = (
-        Index("idx_parsing_history_document_id", "document_id"),
+        # Serves get_parsing_history: filter document_id, ORDER BY created_at DESC LIMIT
+        Index("idx_parsing_history_document_id_created", "document_id", "created_at"),
+        # Only the current version of each document: serves the "mark previous versions
+        # not latest" UPDATE without walking the document's whole history
+        Index("idx_parsing_history_document_latest", "document_id", sqlite_where=text("is_latest = 1")),
         Index("idx_parsing_history_version_folder", "version_folder"),
+        # Serves the parsed-documents listing: filter status/is_latest, ORDER BY created_at DESC LIMIT
+        Index("idx_parsing_history_status_latest_created", "parsing_status", "is_latest", "created_at"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -117,10 +142,12 @@ class ParsingHistory(Base):
     # Error and duration
     error_message = Column(Text)
     duration_seconds = Column(Float)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     # Relationships
-    document = relationship("Document", back_populates="parsing_history")
+    # History rows are almost always read with their document; load documents for a
+    # batch of histories with one SELECT ... WHERE id IN (...) instead of one per row
+    document = relationship("Document", back_populates="parsing_history", lazy="selectin")
 
     def __repr__(self):
         return f"<ParsingHistory(id={self.id}, document_id={self.document_id}, version='{self.version_folder}', status='{self.parsing_status}')>"
@@ -146,7 +173,7 @@ class Picture(Base):
     area = Column(Integer)  # width * height
     description = Column(Text)  # VLM-generated description
     image_path = Column(String)  # pictures/picture_001.png
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
 
     # Relationships
     document = relationship("Document", back_populates="pictures")
@@ -165,8 +192,8 @@ class DifyConfig(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     api_key = Column(String, nullable=False)
     base_url = Column(String, nullable=False, default="https://api.dify.ai")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f"<DifyConfig(id={self.id}, base_url='{self.base_url}')>"
@@ -191,7 +218,7 @@ class DifyUploadLog(Base):
     dify_document_id = Column(String)  # Dify document ID
     batch_id = Column(String)  # Dify batch ID
     indexing_status = Column(String, default="waiting")  # waiting, parsing, cleaning, splitting, indexing, completed, error
-    uploaded_at = Column(DateTime, default=datetime.utcnow)
+    uploaded_at = Column(DateTime, default=func.now(), server_default=func.now())
     completed_at = Column(DateTime)
 
     def __repr__(self):
@@ -17,6 +17,12 @@ def init_db():
     # Create all tables defined in db_models
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips existing tables, so indexes added to a model later
+    # are created here for databases that predate them
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
     print("Database initialized successfully!")
     print("Created tables:")
     for table in Base.metadata.sorted_tables:
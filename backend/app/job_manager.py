@@ -2,13 +2,35 @@
 Job Manager for Background Parsing Tasks
 
 Manages asynchronous document parsing jobs with progress tracking.
+
+Jobs live in process memory by default. Set JOB_REDIS_URL to keep them in Redis
+instead, so every uvicorn worker sees the same jobs, they survive restarts, and
+finished jobs expire through the key TTL.
 """
 
+import heapq
+import json
+import logging
+import os
+import threading
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel
+
+# redis is optional: without it (or without JOB_REDIS_URL) jobs stay in memory
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Redis URL for the shared job store (unset = in-memory store)
+JOB_REDIS_URL = os.getenv("JOB_REDIS_URL", "")
+# Seconds a job key lives after its last update in Redis
+JOB_REDIS_TTL_SECONDS = int(os.getenv("JOB_REDIS_TTL_SECONDS", str(24 * 3600)))
 
 
 class JobStatus(str, Enum):
@@ -19,30 +41,114 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
-class JobProgress(BaseModel):
-    """Job progress information"""
+@dataclass(slots=True)
+class JobProgress:
+    """
+    Job progress information
+
+    A plain slotted dataclass: jobs are internal bookkeeping mutated on every
+    progress update, so no validation runs on construction or assignment.
+    """
     job_id: str
     filename: str
     status: JobStatus
+    created_at: datetime
     progress: int = 0  # 0-100
     message: str = ""
-    created_at: datetime
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job as a dict (timestamps stay datetime objects)."""
+        return asdict(self)
+
+
+def _new_job(filename: str) -> JobProgress:
+    return JobProgress(
+        job_id=str(uuid.uuid4()),
+        filename=filename,
+        status=JobStatus.QUEUED,
+        created_at=datetime.utcnow()
+    )
+
+
+def _complete(job: JobProgress) -> bool:
+    """
+    Stamp completed_at on the first completion only.
+
+    Returns True if this call completed the job, so repeated set_result/set_error
+    calls don't move the timestamp.
+    """
+    if job.completed_at is not None:
+        return False
+    job.completed_at = datetime.utcnow()
+    return True
+
+
+def _apply_progress(
+    job: JobProgress,
+    status: Optional[JobStatus],
+    progress: Optional[int],
+    message: Optional[str]
+) -> bool:
+    """Apply an update_progress call to a job; returns True if it completed the job"""
+    completed = False
+    if status:
+        job.status = status
+
+        # Set timestamps
+        if status == JobStatus.PROCESSING and not job.started_at:
+            job.started_at = datetime.utcnow()
+        elif status in [JobStatus.COMPLETED, JobStatus.FAILED]:
+            completed = _complete(job)
+
+    if progress is not None:
+        job.progress = min(100, max(0, progress))
 
-class JobManager:
+    if message is not None:
+        job.message = message
+
+    return completed
+
+
+def _apply_result(job: JobProgress, result: Dict[str, Any]) -> bool:
+    job.result = result
+    job.status = JobStatus.COMPLETED
+    job.progress = 100
+    return _complete(job)
+
+
+def _apply_error(job: JobProgress, error: str) -> bool:
+    job.error = error
+    job.status = JobStatus.FAILED
+    return _complete(job)
+
+
+class InMemoryJobManager:
     """
     In-memory job manager for parsing tasks
 
-    Note: Jobs are stored in memory and will be lost on server restart.
-    For production, consider using Redis or a database.
+    Note: Jobs are stored in memory and will be lost on server restart, and each
+    worker process has its own jobs. Use RedisJobManager (JOB_REDIS_URL) to share them.
+
+    Thread-safe: progress callbacks arrive from worker threads (asyncio.to_thread)
+    while route handlers read and create jobs, so every mutation holds one RLock.
     """
 
     def __init__(self):
         self._jobs: Dict[str, JobProgress] = {}
+        # Min-heap of (completed_at, job_id) for finished jobs, so cleanup only
+        # touches the jobs it evicts; entries whose job was deleted since are
+        # skipped as stale
+        self._done_heap: List[Tuple[datetime, str]] = []
+        self._lock = threading.RLock()
+
+    def _index_completed(self, job_id: str, job: JobProgress, completed: bool) -> None:
+        """Index a newly completed job for cleanup (caller holds the lock)"""
+        if completed:
+            heapq.heappush(self._done_heap, (job.completed_at, job_id))
 
     def create_job(self, filename: str) -> str:
         """
@@ -54,17 +160,10 @@ class JobManager:
         Returns:
             job_id: Unique job identifier
         """
-        job_id = str(uuid.uuid4())
-
-        job = JobProgress(
-            job_id=job_id,
-            filename=filename,
-            status=JobStatus.QUEUED,
-            created_at=datetime.utcnow()
-        )
-
-        self._jobs[job_id] = job
-        return job_id
+        job = _new_job(filename)
+        with self._lock:
+            self._jobs[job.job_id] = job
+        return job.job_id
 
     def get_job(self, job_id: str) -> Optional[JobProgress]:
         """Get job by ID"""
@@ -86,46 +185,29 @@ class JobManager:
             progress: Progress percentage 0-100 (optional)
             message: Progress message (optional)
         """
-        job = self._jobs.get(job_id)
-        if not job:
-            return
-
-        if status:
-            job.status = status
-
-            # Set timestamps
-            if status == JobStatus.PROCESSING and not job.started_at:
-                job.started_at = datetime.utcnow()
-            elif status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-                job.completed_at = datetime.utcnow()
-
-        if progress is not None:
-            job.progress = min(100, max(0, progress))
-
-        if message is not None:
-            job.message = message
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._index_completed(job_id, job, _apply_progress(job, status, progress, message))
 
     def set_result(self, job_id: str, result: Dict[str, Any]) -> None:
         """Set job result (on success)"""
-        job = self._jobs.get(job_id)
-        if job:
-            job.result = result
-            job.status = JobStatus.COMPLETED
-            job.progress = 100
-            job.completed_at = datetime.utcnow()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._index_completed(job_id, job, _apply_result(job, result))
 
     def set_error(self, job_id: str, error: str) -> None:
         """Set job error (on failure)"""
-        job = self._jobs.get(job_id)
-        if job:
-            job.error = error
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.utcnow()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._index_completed(job_id, job, _apply_error(job, error))
 
     def delete_job(self, job_id: str) -> None:
         """Delete job from memory"""
-        if job_id in self._jobs:
-            del self._jobs[job_id]
+        with self._lock:
+            self._jobs.pop(job_id, None)
 
     def cleanup_old_jobs(self, hours: int = 24) -> int:
         """
@@ -137,20 +219,127 @@ class JobManager:
         Returns:
             Number of deleted jobs
         """
-        from datetime import timedelta
-
         cutoff = datetime.utcnow() - timedelta(hours=hours)
-        to_delete = []
+        deleted = 0
+
+        # Pop only the expired heap entries instead of scanning every job
+        with self._lock:
+            while self._done_heap and self._done_heap[0][0] < cutoff:
+                completed_at, job_id = heapq.heappop(self._done_heap)
+                job = self._jobs.get(job_id)
+                if job is not None and job.completed_at == completed_at:
+                    del self._jobs[job_id]
+                    deleted += 1
+
+        return deleted
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
 
-        for job_id, job in self._jobs.items():
-            if job.completed_at and job.completed_at < cutoff:
-                to_delete.append(job_id)
 
-        for job_id in to_delete:
-            del self._jobs[job_id]
+_DATETIME_FIELDS = ("created_at", "started_at", "completed_at")
+
+
+def _dump_job(job: JobProgress) -> str:
+    return json.dumps(asdict(job), ensure_ascii=False, default=_json_default)
+
+
+def _load_job(raw: bytes) -> JobProgress:
+    data = json.loads(raw)
+    data["status"] = JobStatus(data["status"])
+    for field in _DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return JobProgress(**data)
+
+
+class RedisJobManager:
+    """
+    Redis-backed job manager with the same interface as InMemoryJobManager
+
+    Each job is one JSON string at job:{id}, written with SET ... EX so finished
+    jobs expire on their own (cleanup_old_jobs is a no-op). Updates are
+    read-modify-write under WATCH/MULTI/EXEC, so concurrent progress updates from
+    different workers don't overwrite each other.
+
+    The client is synchronous on purpose: progress callbacks run in worker
+    threads, and each call is a single short round trip.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = JOB_REDIS_TTL_SECONDS, key_prefix: str = "job:"):
+        self._client = redis.Redis.from_url(url)
+        self._ttl = ttl_seconds
+        self._prefix = key_prefix
+
+    def _key(self, job_id: str) -> str:
+        return f"{self._prefix}{job_id}"
+
+    def _update(self, job_id: str, apply: Callable[[JobProgress], Any]) -> None:
+        """Apply ``apply`` to the stored job atomically (retried if the key changes meanwhile)"""
+        key = self._key(job_id)
+
+        def _transaction(pipe):
+            raw = pipe.get(key)
+            if raw is None:
+                return
+            job = _load_job(raw)
+            apply(job)
+            pipe.multi()
+            pipe.set(key, _dump_job(job), ex=self._ttl)
+
+        self._client.transaction(_transaction, key)
+
+    def create_job(self, filename: str) -> str:
+        """Create a new parsing job and return its ID"""
+        job = _new_job(filename)
+        self._client.set(self._key(job.job_id), _dump_job(job), ex=self._ttl)
+        return job.job_id
+
+    def get_job(self, job_id: str) -> Optional[JobProgress]:
+        """Get job by ID"""
+        raw = self._client.get(self._key(job_id))
+        return _load_job(raw) if raw is not None else None
+
+    def update_progress(
+        self,
+        job_id: str,
+        status: Optional[JobStatus] = None,
+        progress: Optional[int] = None,
+        message: Optional[str] = None
+    ) -> None:
+        """Update job progress (see InMemoryJobManager.update_progress)"""
+        self._update(job_id, lambda job: _apply_progress(job, status, progress, message))
+
+    def set_result(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Set job result (on success)"""
+        self._update(job_id, lambda job: _apply_result(job, result))
+
+    def set_error(self, job_id: str, error: str) -> None:
+        """Set job error (on failure)"""
+        self._update(job_id, lambda job: _apply_error(job, error))
+
+    def delete_job(self, job_id: str) -> None:
+        """Delete job from Redis"""
+        self._client.delete(self._key(job_id))
+
+    def cleanup_old_jobs(self, hours: int = 24) -> int:
+        """No-op: Redis expires job keys through their TTL"""
+        return 0
+
 
-        return len(to_delete)
+def _create_job_manager():
+    """Pick the job store from JOB_REDIS_URL (falls back to in-memory)"""
+    if not JOB_REDIS_URL:
+        return InMemoryJobManager()
+    if redis is None:
+        logger.warning("⚠️ JOB_REDIS_URL is set but the redis package is not installed; using in-memory jobs")
+        return InMemoryJobManager()
+    logger.info(f"🗄️ Using Redis job store (TTL {JOB_REDIS_TTL_SECONDS}s)")
+    return RedisJobManager(JOB_REDIS_URL)
 
 
 # Global job manager instance
-job_manager = JobManager()
+job_manager = _create_job_manager()
@@ -8,6 +8,7 @@ with optional VLM picture description.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Import configuration
 from app.config import (
@@ -23,9 +24,6 @@ from app.config import (
 # Import routers
 from app.api import health, documents, parsing, results, database, async_parsing, dify
 
-# Import database initialization
-from app.init_db import init_db
-
 # Import logging configuration
 from app.logging_config import configure_logging
 
@@ -37,10 +35,11 @@ configure_logging()
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
-    Initializes the database on startup.
+
+    The schema is not created here: run `python -m app.init_db` once before
+    starting the server (start-dev.ps1 does), so worker boots don't each
+    issue CREATE TABLE/INDEX checks or race on the SQLite file.
     """
-    # Startup: Initialize database
-    init_db()
     yield
     # Shutdown: cleanup (if needed)
 
@@ -60,8 +59,14 @@ app.add_middleware(
     allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=CORS_ALLOW_METHODS,
     allow_headers=CORS_ALLOW_HEADERS,
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Add GZip middleware
+# Parse results embed the full Markdown content, which compresses well;
+# a low compresslevel keeps CPU cost small for multi-MB payloads
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=3)
+
 # Register routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(documents.router, tags=["Documents"])
@@ -241,7 +241,12 @@ def extract_table_from_region(
     if not PDFPLUMBER_AVAILABLE:
         return None
 
-    table_settings = {
+    return extract_tables_from_regions(pdf_path, [(page_num, bbox)], **kwargs)[0]
+
+
+def _region_table_settings(**kwargs) -> Dict:
+    """Text-alignment table settings used for region re-extraction"""
+    return {
         'vertical_strategy': 'text',
         'horizontal_strategy': 'text',
         'text_tolerance': 3,
@@ -249,29 +254,78 @@ def extract_table_from_region(
         **kwargs
     }
 
-    try:
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            page = pdf.pages[page_num - 1]  # Convert to 0-based
 
-            # Crop to the specified region
-            cropped = page.crop(bbox)
+def _extract_region(page, bbox: Tuple[float, float, float, float], table_settings: Dict) -> Optional[pd.DataFrame]:
+    """Extract one table from a region of an already-open pdfplumber page"""
+    # Crop to the specified region
+    cropped = page.crop(bbox)
 
-            # Extract table
-            table = cropped.extract_table(table_settings)
+    # Extract table
+    table = cropped.extract_table(table_settings)
 
-            if table and len(table) >= 2:
-                # Convert to DataFrame
-                df = pd.DataFrame(table[1:], columns=table[0])
-                df = df.dropna(how='all', axis=1)
-                df = df.dropna(how='all', axis=0)
+    if table and len(table) >= 2:
+        # Convert to DataFrame
+        df = pd.DataFrame(table[1:], columns=table[0])
+        df = df.dropna(how='all', axis=1)
+        df = df.dropna(how='all', axis=0)
 
-                return df if not df.empty else None
+        return df if not df.empty else None
 
-        return None
+    return None
+
+
+def extract_tables_from_regions(
+    pdf_path: Path,
+    regions: List[Tuple[int, Tuple[float, float, float, float]]],
+    **kwargs
+) -> List[Optional[pd.DataFrame]]:
+    """
+    Extract tables from several page regions with a single pdfplumber pass.
+
+    The PDF is opened (and its object tree parsed) once, and each page is
+    loaded once no matter how many regions it contains.
+
+    Args:
+        pdf_path: Path to PDF file
+        regions: (page_num, bbox) pairs; page_num is 1-based, bbox in PDF coordinates
+        **kwargs: Additional pdfplumber parameters
+
+    Returns:
+        One DataFrame (or None if extraction failed) per region, in input order
+    """
+    results: List[Optional[pd.DataFrame]] = [None] * len(regions)
+    if not PDFPLUMBER_AVAILABLE or not regions:
+        return results
+
+    table_settings = _region_table_settings(**kwargs)
+
+    # Group region indices by page so every page is loaded once
+    regions_by_page: Dict[int, List[int]] = {}
+    for idx, (page_num, _) in enumerate(regions):
+        regions_by_page.setdefault(page_num, []).append(idx)
+
+    try:
+        with pdfplumber.open(str(pdf_path)) as pdf:
+            for page_num, indices in sorted(regions_by_page.items()):
+                try:
+                    page = pdf.pages[page_num - 1]  # Convert to 0-based
+                except IndexError:
+                    logger.warning(f"Failed to extract table from region: page {page_num} out of range")
+                    continue
+
+                for idx in indices:
+                    try:
+                        results[idx] = _extract_region(page, regions[idx][1], table_settings)
+                    except Exception as e:
+                        logger.warning(f"Failed to extract table from region: {e}")
+
+                # Release cached layout objects before moving to the next page
+                page.close()
 
     except Exception as e:
         logger.warning(f"Failed to extract table from region: {e}")
-        return None
+
+    return results
 
 
 def validate_pdfplumber_available() -> bool:
@@ -4,12 +4,17 @@
 중복 코드를 제거하고 일관된 파일 처리를 제공합니다.
 """
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import json
 
 
+# 목록 조회용 미리보기 파일 (content.md 앞부분 캐시)
+PREVIEW_FILENAME = "preview.txt"
+PREVIEW_CHARS = 500
+
+
 def create_document_output_dir(
     file_path: Path,
     base_dir: Path
@@ -117,6 +122,24 @@ def save_parsing_output(
     return content_path
 
 
+def save_preview_file(output_dir: Path, content: str) -> Path:
+    """목록 조회용 미리보기 파일 저장
+
+    파싱 시점에 컨텐츠 앞부분을 별도 파일로 저장하여
+    문서 목록 API가 content.md 전체를 열지 않도록 합니다.
+
+    Args:
+        output_dir: 출력 디렉토리 (content.md와 같은 위치)
+        content: 파싱된 컨텐츠
+
+    Returns:
+        저장된 미리보기 파일 경로
+    """
+    preview_path = output_dir / PREVIEW_FILENAME
+    preview_path.write_text(content[:PREVIEW_CHARS], encoding='utf-8')
+    return preview_path
+
+
 def generate_version_folder_name(
     strategy: str, options: Optional[Dict[str, Any]] = None
 ) -> str:
@@ -214,3 +237,48 @@ def create_versioned_output_dir(
     versioned_dir.mkdir(parents=True, exist_ok=True)
 
     return versioned_dir
+
+
+def prepare_output_layout(
+    file_path: Path,
+    base_dir: Path,
+    strategy: str,
+    options: Optional[Dict[str, Any]] = None,
+    has_tables: bool = False,
+    has_images: bool = False
+) -> Tuple[str, Path, OutputStructure]:
+    """버전 폴더명 생성 + 디렉토리 생성 + 출력 구조 생성을 한 번에 처리
+
+    generate_version_folder_name → create_versioned_output_dir →
+    build_output_structure 순서의 호출을 하나로 합칩니다.
+
+    Args:
+        file_path: 원본 파일 경로
+        base_dir: 기본 출력 디렉토리 (예: OUTPUT_FOLDER)
+        strategy: 파싱 전략명 (예: "Remote OCR", "MinerU")
+        options: 파싱 옵션 딕셔너리 (옵션)
+        has_tables: 테이블 디렉토리 포함 여부
+        has_images: 이미지 디렉토리 포함 여부
+
+    Returns:
+        (version_folder, doc_output_dir, output_structure) 튜플
+
+    Example:
+        >>> from app.config import OUTPUT_FOLDER
+        >>> version_folder, output_dir, structure = prepare_output_layout(
+        ...     Path("docu/sample.pdf"),
+        ...     OUTPUT_FOLDER,
+        ...     "Remote OCR",
+        ...     {"remote_ocr_engine": "upstage"}
+        ... )
+        >>> print(version_folder)
+        'remote-ocr_upstage_20251105-163045'
+    """
+    version_folder = generate_version_folder_name(strategy=strategy, options=options)
+    doc_output_dir = create_versioned_output_dir(
+        file_path=file_path, base_dir=base_dir, version_folder=version_folder
+    )
+    output_structure = build_output_structure(
+        doc_output_dir, has_tables=has_tables, has_images=has_images
+    )
+    return version_folder, doc_output_dir, output_structure
@@ -3,6 +3,9 @@ Database helper functions for parsing operations.
 
 Provides centralized DB save logic to avoid code duplication between
 parsing.py and async_parsing.py.
+
+Each helper commits its own unit of work: CRUD helpers only flush, and these
+also run from background jobs after the request's get_db session has closed.
 """
 
 import logging
@@ -57,9 +60,12 @@ def create_or_update_document_record(
             db_document = crud.create_document(db, doc_create)
             logger.info(f"📝 Created new document record (ID: {db_document.id})")
 
+        # Commit now so the "processing" status is visible while parsing runs
+        db.commit()
         return db_document
 
     except Exception as e:
+        db.rollback()
         logger.error(f"Error creating/updating document record: {str(e)}", exc_info=True)
         return None
 
@@ -150,7 +156,6 @@ def save_parsing_success(
                     db_models.ParsingHistory.document_id == db_document.id,
                     db_models.ParsingHistory.is_latest == True
                 ).update({"is_latest": False})
-                db.commit()
             except Exception as e:
                 logger.warning(f"Error updating previous versions: {str(e)}")
 
@@ -185,9 +190,12 @@ def save_parsing_success(
         except Exception as e:
             logger.error(f"Error creating parsing history: {str(e)}", exc_info=True)
 
+        # Document status, tables, version flags and history land in one transaction
+        db.commit()
         return True
 
     except Exception as e:
+        db.rollback()
         logger.error(f"Error updating database after parsing: {str(e)}", exc_info=True)
         return False
 
@@ -253,8 +261,10 @@ def save_parsing_failure(
         except Exception as e:
             logger.error(f"Error creating error history: {str(e)}", exc_info=True)
 
+        db.commit()
         return True
 
     except Exception as e:
+        db.rollback()
         logger.error(f"Error updating database after parsing failure: {str(e)}", exc_info=True)
         return False